@@ -504,13 +504,10 @@ async def get_statistics():
         predictions = safe_predict(X_array)
         
         # Calculate stats
-        categories = []
-        for aqi in predictions:
-            try:
-                cat = risk_calculator.get_aqi_category(float(aqi))
-                categories.append(cat.value if cat else "Unknown")
-            except:
-                categories.append("Unknown")
+        categories = [
+            cat.value if cat else "Unknown"
+            for cat in risk_calculator.get_aqi_category_array(predictions)
+        ]
         
         category_counts = pd.Series(categories).value_counts().to_dict()
         
@@ -82,10 +82,10 @@ class DataCollector:
             combined_df = pd.concat(all_data, ignore_index=True)
             
             # Clean data
-            combined_df = self.processor.clean_data(combined_df)
+            combined_df = self.processor.clean_data(combined_df, copy=False)
             
             # Fill missing AQI values
-            combined_df = self.processor.fill_missing_aqi(combined_df)
+            combined_df = self.processor.fill_missing_aqi(combined_df, copy=False)
             
             return combined_df
         
@@ -168,7 +168,7 @@ class DataCollector:
             combined_df['city_name'] = city['name']
             combined_df['country_code'] = city['country']
             
-            return self.processor.clean_data(combined_df)
+            return self.processor.clean_data(combined_df, copy=False)
         
         logger.warning(f"  No historical data collected for {city['name']}")
         return pd.DataFrame()
@@ -1 +1,5 @@
-"""Package initialization"""
\ No newline at end of file
+"""Package initialization"""
+import logging
+
+# Configure logging once for the whole data pipeline package
+logging.basicConfig(level=logging.INFO)
@@ -2,20 +2,88 @@
 API clients for fetching air quality and weather data
 """
 import requests
+import orjson
 import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import logging
 from src.config.config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class OpenWeatherMapClient:
+class ConditionalAPIClient:
+    """
+    Base client that reuses one HTTP session and revalidates cached
+    responses with ETag / Last-Modified instead of refetching them
+    """
+    
+    # Number of parsed responses kept for 304 Not Modified replies
+    CACHE_SIZE = 128
+    
+    def __init__(self):
+        self.session = requests.Session()
+        self._validators = {}
+        self._response_cache = OrderedDict()
+    
+    def _conditional_get(self, url: str, params: Dict) -> Dict:
+        """
+        GET a JSON resource, sending If-None-Match / If-Modified-Since when
+        a previous response for the same URL and params is cached
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            
+        Returns:
+            Parsed JSON body (cached copy on 304 Not Modified)
+        """
+        key = (url, tuple(sorted(params.items())))
+        headers = self._validators.get(key, {})
+        
+        response = self.session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=Config.data_collection.REQUEST_TIMEOUT
+        )
+        
+        if response.status_code == 304 and key in self._response_cache:
+            self._response_cache.move_to_end(key)
+            return self._response_cache[key]
+        
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Remember validators for the next request to this resource
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        
+        if validators:
+            self._validators[key] = validators
+            self._response_cache[key] = data
+            self._response_cache.move_to_end(key)
+            
+            if len(self._response_cache) > self.CACHE_SIZE:
+                evicted, _ = self._response_cache.popitem(last=False)
+                self._validators.pop(evicted, None)
+        else:
+            self._validators.pop(key, None)
+            self._response_cache.pop(key, None)
+        
+        return data
+
+
+class OpenWeatherMapClient(ConditionalAPIClient):
     """Client for OpenWeatherMap API"""
     
     def __init__(self, api_key: str = None):
+        super().__init__()
         self.api_key = api_key or Config.api.OPENWEATHER_API_KEY
         self.base_url = Config.api.OPENWEATHER_BASE_URL
         self.air_url = Config.api.OPENWEATHER_AIR_URL
@@ -37,15 +105,9 @@ class OpenWeatherMapClient:
                 'lon': lon,
                 'appid': self.api_key
             }
-            response = requests.get(
-                f"{self.air_url}/forecast",
-                params=params,
-                timeout=Config.data_collection.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(f"{self.air_url}/forecast", params)
         except Exception as e:
-            logger.error(f"Error fetching air quality data: {e}")
+            logger.error("Error fetching air quality data: %s", e)
             return None
     
     def get_weather_data(self, lat: float, lon: float) -> Optional[Dict]:
@@ -66,15 +128,9 @@ class OpenWeatherMapClient:
                 'appid': self.api_key,
                 'units': 'metric'
             }
-            response = requests.get(
-                f"{self.base_url}/weather",
-                params=params,
-                timeout=Config.data_collection.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(f"{self.base_url}/weather", params)
         except Exception as e:
-            logger.error(f"Error fetching weather data: {e}")
+            logger.error("Error fetching weather data: %s", e)
             return None
     
     def get_historical_air_quality(
@@ -104,15 +160,9 @@ class OpenWeatherMapClient:
                 'end': end_timestamp,
                 'appid': self.api_key
             }
-            response = requests.get(
-                f"{self.air_url}/history",
-                params=params,
-                timeout=Config.data_collection.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(f"{self.air_url}/history", params)
         except Exception as e:
-            logger.error(f"Error fetching historical air quality: {e}")
+            logger.error("Error fetching historical air quality: %s", e)
             return None
 
 
@@ -148,9 +198,9 @@ class IQAirClient:
                 timeout=Config.data_collection.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error(f"Error fetching IQAir data for {city}: {e}")
+            logger.error("Error fetching IQAir data for %s: %s", city, e)
             return None
     
     def get_nearest_city(self, lat: float, lon: float) -> Optional[Dict]:
@@ -176,9 +226,9 @@ class IQAirClient:
                 timeout=Config.data_collection.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error(f"Error fetching nearest city data: {e}")
+            logger.error("Error fetching nearest city data: %s", e)
             return None
 
 
@@ -231,9 +281,9 @@ class OpenAQClient:
                 timeout=Config.data_collection.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error(f"Error fetching OpenAQ v3 data: {e}")
+            logger.error("Error fetching OpenAQ v3 data: %s", e)
             return None
 
     def get_measurements(
@@ -293,7 +343,7 @@ class OpenAQClient:
                 timeout=Config.data_collection.REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Transform v3 response to match expected format
             if data and 'results' in data:
@@ -302,14 +352,15 @@ class OpenAQClient:
                 return {'results': []}
 
         except Exception as e:
-            logger.error(f"Error fetching measurements from v3: {e}")
+            logger.error("Error fetching measurements from v3: %s", e)
             return None
 
 
-class WAQIClient:
+class WAQIClient(ConditionalAPIClient):
     """Client for World Air Quality Index API"""
     
     def __init__(self, api_key: str = None):
+        super().__init__()
         self.api_key = api_key or Config.api.WAQI_API_KEY
         self.base_url = Config.api.WAQI_BASE_URL
         
@@ -327,15 +378,9 @@ class WAQIClient:
             url = f"{self.base_url}/feed/{city}/"
             params = {'token': self.api_key}
             
-            response = requests.get(
-                url,
-                params=params,
-                timeout=Config.data_collection.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url, params)
         except Exception as e:
-            logger.error(f"Error fetching WAQI data for {city}: {e}")
+            logger.error("Error fetching WAQI data for %s: %s", city, e)
             return None
     
     def get_geo_feed(self, lat: float, lon: float) -> Optional[Dict]:
@@ -353,15 +398,9 @@ class WAQIClient:
             url = f"{self.base_url}/feed/geo:{lat};{lon}/"
             params = {'token': self.api_key}
             
-            response = requests.get(
-                url,
-                params=params,
-                timeout=Config.data_collection.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url, params)
         except Exception as e:
-            logger.error(f"Error fetching WAQI geo data: {e}")
+            logger.error("Error fetching WAQI geo data: %s", e)
             return None
     
     def search_stations(self, keyword: str) -> Optional[Dict]:
@@ -381,15 +420,9 @@ class WAQIClient:
                 'keyword': keyword
             }
             
-            response = requests.get(
-                url,
-                params=params,
-                timeout=Config.data_collection.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url, params)
         except Exception as e:
-            logger.error(f"Error searching stations: {e}")
+            logger.error("Error searching stations: %s", e)
             return None
 
 
@@ -419,26 +452,33 @@ class APIClientManager:
             'location': {'lat': lat, 'lon': lon, 'city': city}
         }
         
-        # Fetch from OpenWeatherMap
-        logger.info("Fetching from OpenWeatherMap...")
-        data['openweather_air'] = self.openweather.get_current_air_quality(lat, lon)
-        data['openweather_weather'] = self.openweather.get_weather_data(lat, lon)
-        time.sleep(1)  # Rate limiting
-        
-        # Fetch from OpenAQ
-        logger.info("Fetching from OpenAQ...")
-        data['openaq'] = self.openaq.get_latest_measurements(coordinates=(lat, lon))
-        time.sleep(1)
+        verbose = logger.isEnabledFor(logging.INFO)
         
-        # Fetch from WAQI
-        logger.info("Fetching from WAQI...")
-        data['waqi'] = self.waqi.get_geo_feed(lat, lon)
-        time.sleep(1)
+        # Each provider is a separate host with its own rate limit, so the
+        # probes run concurrently; wall time is the slowest source, not the sum
+        probes = {
+            'OpenWeatherMap': lambda: {
+                'openweather_air': self.openweather.get_current_air_quality(lat, lon),
+                'openweather_weather': self.openweather.get_weather_data(lat, lon)
+            },
+            'OpenAQ': lambda: {'openaq': self.openaq.get_latest_measurements(coordinates=(lat, lon))},
+            'WAQI': lambda: {'waqi': self.waqi.get_geo_feed(lat, lon)}
+        }
         
         # Fetch from IQAir (if city provided)
         if city:
-            logger.info("Fetching from IQAir...")
-            data['iqair'] = self.iqair.get_nearest_city(lat, lon)
-            time.sleep(1)
+            probes['IQAir'] = lambda: {'iqair': self.iqair.get_nearest_city(lat, lon)}
+        
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {}
+            for source, probe in probes.items():
+                if verbose:
+                    logger.info(f"Fetching from {source}...")
+                futures[source] = executor.submit(probe)
+            
+            for future in futures.values():
+                data.update(future.result())
+        
+        time.sleep(1)  # Rate limiting before the next location hits the same providers
         
         return data
\ No newline at end of file
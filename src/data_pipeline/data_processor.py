@@ -3,34 +3,76 @@ Data processor to clean and standardize air quality data from multiple sources
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# US EPA AQI breakpoints for PM2.5: (bp_lo, bp_hi, aqi_lo, aqi_hi)
+PM25_AQI_BREAKPOINTS = (
+    (0, 12.0, 0, 50),
+    (12.1, 35.4, 51, 100),
+    (35.5, 55.4, 101, 150),
+    (55.5, 150.4, 151, 200),
+    (150.5, 250.4, 201, 300),
+    (250.5, 500.4, 301, 500)
+)
+
+
+def _remove_tz(ts):
+    """Drop tzinfo from a single timestamp, keeping its wall-clock time"""
+    if getattr(ts, 'tzinfo', None) is not None:
+        return ts.replace(tzinfo=None)
+    return ts
+
 
 class AirQualityDataProcessor:
     """Process and standardize air quality data from different sources"""
     
-    def __init__(self):
-        self.pollutant_mapping = {
-            'pm2.5': 'pm25',
-            'pm25': 'pm25',
-            'pm10': 'pm10',
-            'no2': 'no2',
-            'so2': 'so2',
-            'o3': 'o3',
-            'co': 'co'
-        }
+    # Source pollutant name -> standard column
+    POLLUTANT_MAPPING = {
+        'pm2.5': 'pm25',
+        'pm25': 'pm25',
+        'pm10': 'pm10',
+        'no2': 'no2',
+        'so2': 'so2',
+        'o3': 'o3',
+        'co': 'co'
+    }
     
-    def normalize_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
+    # OpenWeatherMap component name -> standard column
+    _OPENWEATHER_COMPONENTS = {
+        'pm2_5': 'pm25',
+        'pm10': 'pm10',
+        'no2': 'no2',
+        'so2': 'so2',
+        'o3': 'o3',
+        'co': 'co'
+    }
+    
+    # WAQI iaqi key -> standard column (pollutants, then weather)
+    _WAQI_RENAME = {
+        'pm25': 'pm25',
+        'pm10': 'pm10',
+        'no2': 'no2',
+        'so2': 'so2',
+        'o3': 'o3',
+        'co': 'co',
+        't': 'temperature',
+        'h': 'humidity',
+        'p': 'pressure',
+        'w': 'wind_speed'
+    }
+    
+    @staticmethod
+    def normalize_timestamps(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Normalize timestamps to remove timezone information
         
         Args:
             df: DataFrame with timestamp column
+            copy: If False, rewrite the timestamp column of df in place
             
         Returns:
             DataFrame with normalized timestamps
@@ -38,29 +80,29 @@ class AirQualityDataProcessor:
         if df is None or df.empty or 'timestamp' not in df.columns:
             return df
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
+        
+        timestamps = df['timestamp']
+        
+        # Mixed tz-aware and tz-naive values (e.g. after combining sources)
+        # stay object dtype - strip tz per value so they don't coerce to NaT
+        if timestamps.dtype == object:
+            timestamps = timestamps.map(_remove_tz)
         
         # Convert to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+        timestamps = pd.to_datetime(timestamps, errors='coerce')
         
         # Remove timezone info to make all tz-naive
-        if hasattr(df['timestamp'].dtype, 'tz') and df['timestamp'].dt.tz is not None:
-            # All timestamps are tz-aware
-            df['timestamp'] = df['timestamp'].dt.tz_localize(None)
-        else:
-            # Mixed tz-aware and tz-naive - normalize each row
-            def remove_tz(ts):
-                if pd.isna(ts):
-                    return ts
-                if hasattr(ts, 'tzinfo') and ts.tzinfo is not None:
-                    return ts.tz_localize(None)
-                return ts
-            
-            df['timestamp'] = df['timestamp'].apply(remove_tz)
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        
+        df['timestamp'] = timestamps
         
         return df
     
-    def process_openweather_air(self, data: Dict) -> Optional[pd.DataFrame]:
+    @classmethod
+    def process_openweather_air(cls, data: Dict) -> Optional[pd.DataFrame]:
         """
         Process OpenWeatherMap air quality data
         
@@ -84,22 +126,21 @@ class AirQualityDataProcessor:
                 
                 # Extract pollutant components
                 components = item.get('components', {})
-                record['pm25'] = components.get('pm2_5')
-                record['pm10'] = components.get('pm10')
-                record['no2'] = components.get('no2')
-                record['so2'] = components.get('so2')
-                record['o3'] = components.get('o3')
-                record['co'] = components.get('co')
+                record.update({
+                    new: components.get(old)
+                    for old, new in cls._OPENWEATHER_COMPONENTS.items()
+                })
                 
                 records.append(record)
             
             return pd.DataFrame(records)
         
         except Exception as e:
-            logger.error(f"Error processing OpenWeather air data: {e}")
+            logger.error("Error processing OpenWeather air data: %s", e)
             return None
     
-    def process_openweather_weather(self, data: Dict) -> Optional[pd.DataFrame]:
+    @staticmethod
+    def process_openweather_weather(data: Dict) -> Optional[Dict[str, Any]]:
         """
         Process OpenWeatherMap weather data
         
@@ -107,7 +148,7 @@ class AirQualityDataProcessor:
             data: Raw API response
             
         Returns:
-            Processed DataFrame
+            Single processed record
         """
         try:
             if not data:
@@ -123,13 +164,14 @@ class AirQualityDataProcessor:
                 'wind_direction': data.get('wind', {}).get('deg'),
             }
             
-            return pd.DataFrame([record])
+            return record
         
         except Exception as e:
-            logger.error(f"Error processing OpenWeather weather data: {e}")
+            logger.error("Error processing OpenWeather weather data: %s", e)
             return None
     
-    def process_openaq_data(self, data: Dict) -> Optional[pd.DataFrame]:
+    @classmethod
+    def process_openaq_data(cls, data: Dict) -> Optional[pd.DataFrame]:
         """
         Process OpenAQ data
         
@@ -157,7 +199,7 @@ class AirQualityDataProcessor:
                 # Try to get parameter data
                 parameters = item.get('parameters', []) or item.get('measurements', [])
                 for param in parameters:
-                    param_name = self.pollutant_mapping.get(
+                    param_name = cls.POLLUTANT_MAPPING.get(
                         param.get('parameter', '').lower()
                     )
                     if param_name:
@@ -171,10 +213,11 @@ class AirQualityDataProcessor:
             return None
         
         except Exception as e:
-            logger.error(f"Error processing OpenAQ data: {e}")
+            logger.error("Error processing OpenAQ data: %s", e)
             return None
     
-    def process_waqi_data(self, data: Dict) -> Optional[pd.DataFrame]:
+    @classmethod
+    def process_waqi_data(cls, data: Dict) -> Optional[Dict[str, Any]]:
         """
         Process WAQI (World Air Quality Index) data
         
@@ -182,7 +225,7 @@ class AirQualityDataProcessor:
             data: Raw API response
             
         Returns:
-            Processed DataFrame
+            Single processed record
         """
         try:
             if not data or data.get('status') != 'ok':
@@ -197,38 +240,22 @@ class AirQualityDataProcessor:
                 'city': result_data.get('city', {}).get('name'),
             }
             
-            # Extract pollutant data
+            # Extract pollutant and weather data
             iaqi = result_data.get('iaqi', {})
-            if 'pm25' in iaqi:
-                record['pm25'] = iaqi['pm25'].get('v')
-            if 'pm10' in iaqi:
-                record['pm10'] = iaqi['pm10'].get('v')
-            if 'no2' in iaqi:
-                record['no2'] = iaqi['no2'].get('v')
-            if 'so2' in iaqi:
-                record['so2'] = iaqi['so2'].get('v')
-            if 'o3' in iaqi:
-                record['o3'] = iaqi['o3'].get('v')
-            if 'co' in iaqi:
-                record['co'] = iaqi['co'].get('v')
-            
-            # Extract weather data
-            if 't' in iaqi:
-                record['temperature'] = iaqi['t'].get('v')
-            if 'h' in iaqi:
-                record['humidity'] = iaqi['h'].get('v')
-            if 'p' in iaqi:
-                record['pressure'] = iaqi['p'].get('v')
-            if 'w' in iaqi:
-                record['wind_speed'] = iaqi['w'].get('v')
+            record.update({
+                new: iaqi[old].get('v')
+                for old, new in cls._WAQI_RENAME.items()
+                if old in iaqi
+            })
             
-            return pd.DataFrame([record])
+            return record
         
         except Exception as e:
-            logger.error(f"Error processing WAQI data: {e}")
+            logger.error("Error processing WAQI data: %s", e)
             return None
     
-    def process_iqair_data(self, data: Dict) -> Optional[pd.DataFrame]:
+    @staticmethod
+    def process_iqair_data(data: Dict) -> Optional[Dict[str, Any]]:
         """
         Process IQAir data
         
@@ -236,7 +263,7 @@ class AirQualityDataProcessor:
             data: Raw API response
             
         Returns:
-            Processed DataFrame
+            Single processed record
         """
         try:
             if not data or data.get('status') != 'success':
@@ -262,13 +289,14 @@ class AirQualityDataProcessor:
                 'wind_direction': weather.get('wd'),
             }
             
-            return pd.DataFrame([record])
+            return record
         
         except Exception as e:
-            logger.error(f"Error processing IQAir data: {e}")
+            logger.error("Error processing IQAir data: %s", e)
             return None
     
-    def combine_sources(self, data_dict: Dict) -> Optional[pd.DataFrame]:
+    @classmethod
+    def combine_sources(cls, data_dict: Dict) -> Optional[pd.DataFrame]:
         """
         Combine data from all sources into a single DataFrame
         
@@ -279,41 +307,44 @@ class AirQualityDataProcessor:
             Combined DataFrame
         """
         dfs = []
+        records = []
         
-        # Process each source
+        # Process multi-row sources
         if 'openweather_air' in data_dict:
-            df = self.process_openweather_air(data_dict['openweather_air'])
-            if df is not None and not df.empty:
-                df = self.normalize_timestamps(df)
-                dfs.append(df)
-        
-        if 'openweather_weather' in data_dict:
-            df = self.process_openweather_weather(data_dict['openweather_weather'])
+            df = cls.process_openweather_air(data_dict['openweather_air'])
             if df is not None and not df.empty:
-                df = self.normalize_timestamps(df)
                 dfs.append(df)
         
         if 'openaq' in data_dict:
-            df = self.process_openaq_data(data_dict['openaq'])
+            df = cls.process_openaq_data(data_dict['openaq'])
             if df is not None and not df.empty:
-                df = self.normalize_timestamps(df)
                 dfs.append(df)
         
+        # Process single-record sources, batched into one DataFrame below
+        if 'openweather_weather' in data_dict:
+            record = cls.process_openweather_weather(data_dict['openweather_weather'])
+            if record:
+                records.append(record)
+        
         if 'waqi' in data_dict:
-            df = self.process_waqi_data(data_dict['waqi'])
-            if df is not None and not df.empty:
-                df = self.normalize_timestamps(df)
-                dfs.append(df)
+            record = cls.process_waqi_data(data_dict['waqi'])
+            if record:
+                records.append(record)
         
         if 'iqair' in data_dict:
-            df = self.process_iqair_data(data_dict['iqair'])
-            if df is not None and not df.empty:
-                df = self.normalize_timestamps(df)
-                dfs.append(df)
+            record = cls.process_iqair_data(data_dict['iqair'])
+            if record:
+                records.append(record)
+        
+        if records:
+            dfs.append(pd.DataFrame(records))
         
         # Combine all dataframes
         if dfs:
-            combined_df = pd.concat(dfs, ignore_index=True)
+            combined_df = pd.concat(dfs, ignore_index=True, copy=False)
+            
+            # Normalize timestamps once for all sources
+            combined_df = cls.normalize_timestamps(combined_df, copy=False)
             
             # Add location metadata
             if 'location' in data_dict:
@@ -324,12 +355,15 @@ class AirQualityDataProcessor:
         
         return None
     
-    def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def clean_data(cls, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Clean and standardize the data
         
         Args:
             df: Input DataFrame
+            copy: If False, timestamps are normalized in place on df
+                  (pass only when the caller no longer needs the original)
             
         Returns:
             Cleaned DataFrame
@@ -338,11 +372,12 @@ class AirQualityDataProcessor:
             return df
         
         # Make a copy to avoid modifying original
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
-        # Normalize timestamps
+        # Normalize timestamps (df is already private to this call)
         if 'timestamp' in df.columns:
-            df = self.normalize_timestamps(df)
+            df = cls.normalize_timestamps(df, copy=False)
         
         # Remove duplicates
         if 'source' in df.columns:
@@ -350,8 +385,10 @@ class AirQualityDataProcessor:
         else:
             df = df.drop_duplicates(subset=['timestamp'], keep='first')
         
-        # Sort by timestamp
-        df = df.sort_values('timestamp').reset_index(drop=True)
+        # Sort by timestamp (skipped when the rows already arrive in order)
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp')
+        df = df.reset_index(drop=True)
         
         # Remove rows with missing critical values
         critical_cols = ['pm25', 'aqi', 'timestamp']
@@ -369,12 +406,14 @@ class AirQualityDataProcessor:
         
         return df
     
-    def fill_missing_aqi(self, df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def fill_missing_aqi(cls, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Calculate AQI if missing, based on PM2.5 values
         
         Args:
             df: DataFrame with air quality data
+            copy: If False, the aqi column of df is filled in place
             
         Returns:
             DataFrame with filled AQI values
@@ -382,21 +421,24 @@ class AirQualityDataProcessor:
         if df is None or df.empty:
             return df
         
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
         # Calculate AQI from PM2.5 if AQI is missing but PM2.5 is available
         if 'aqi' in df.columns and 'pm25' in df.columns:
-            missing_aqi = df['aqi'].isna() & df['pm25'].notna()
+            pm_col = df['pm25'].to_numpy(dtype=float, na_value=np.nan)
+            aqi_col = df['aqi'].to_numpy(dtype=float, na_value=np.nan)
+            missing_aqi = np.isnan(aqi_col) & ~np.isnan(pm_col)
             
             if missing_aqi.any():
                 # Simple AQI calculation from PM2.5 (US EPA standard)
-                df.loc[missing_aqi, 'aqi'] = df.loc[missing_aqi, 'pm25'].apply(
-                    lambda x: self._calculate_aqi_from_pm25(x)
-                )
+                aqi_col[missing_aqi] = cls._vectorized_aqi(pm_col[missing_aqi])
+                df['aqi'] = aqi_col
         
         return df
     
-    def _calculate_aqi_from_pm25(self, pm25: float) -> int:
+    @staticmethod
+    def _calculate_aqi_from_pm25(pm25: float) -> int:
         """
         Calculate AQI from PM2.5 concentration (US EPA standard)
         
@@ -409,17 +451,7 @@ class AirQualityDataProcessor:
         if pd.isna(pm25):
             return None
         
-        # US EPA AQI breakpoints for PM2.5
-        breakpoints = [
-            (0, 12.0, 0, 50),
-            (12.1, 35.4, 51, 100),
-            (35.5, 55.4, 101, 150),
-            (55.5, 150.4, 151, 200),
-            (150.5, 250.4, 201, 300),
-            (250.5, 500.4, 301, 500)
-        ]
-        
-        for bp_lo, bp_hi, aqi_lo, aqi_hi in breakpoints:
+        for bp_lo, bp_hi, aqi_lo, aqi_hi in PM25_AQI_BREAKPOINTS:
             if bp_lo <= pm25 <= bp_hi:
                 aqi = ((aqi_hi - aqi_lo) / (bp_hi - bp_lo)) * (pm25 - bp_lo) + aqi_lo
                 return int(round(aqi))
@@ -428,4 +460,29 @@ class AirQualityDataProcessor:
         if pm25 > 500.4:
             return 500
         
-        return None
\ No newline at end of file
+        return None
+    
+    @staticmethod
+    def _vectorized_aqi(pm25: np.ndarray) -> np.ndarray:
+        """
+        Calculate AQI for an array of PM2.5 concentrations (US EPA standard)
+        
+        Args:
+            pm25: PM2.5 concentrations in µg/m³
+            
+        Returns:
+            Array of AQI values (NaN where the concentration is off the scale)
+        """
+        pm25 = np.asarray(pm25, dtype=float)
+        aqi = np.full(pm25.shape, np.nan)
+        
+        for bp_lo, bp_hi, aqi_lo, aqi_hi in PM25_AQI_BREAKPOINTS:
+            in_range = (pm25 >= bp_lo) & (pm25 <= bp_hi)
+            aqi[in_range] = ((aqi_hi - aqi_lo) / (bp_hi - bp_lo)) * (pm25[in_range] - bp_lo) + aqi_lo
+        
+        aqi = np.round(aqi)
+        
+        # If PM2.5 is beyond the scale
+        aqi[pm25 > 500.4] = 500
+        
+        return aqi
\ No newline at end of file
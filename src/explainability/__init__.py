@@ -5,11 +5,13 @@ Provides SHAP-based interpretability for AQI predictions
 from .shap_explainer import (
     SHAPExplainer,
     create_feature_importance_chart_data,
-    explain_aqi_category
+    explain_aqi_category,
+    batch_explain_aqi_category
 )
 
 __all__ = [
     'SHAPExplainer',
     'create_feature_importance_chart_data',
-    'explain_aqi_category'
+    'explain_aqi_category',
+    'batch_explain_aqi_category'
 ]
\ No newline at end of file
@@ -6,19 +6,141 @@ import numpy as np
 import pandas as pd
 import shap
 import pickle
+import joblib
+from joblib import Parallel, delayed
 import json
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import xgboost as xgb
+except ImportError:  # XGBoost is only needed for the GPU TreeSHAP path
+    xgb = None
+
+try:
+    import fasttreeshap
+except ImportError:  # Optional faster TreeSHAP implementation
+    fasttreeshap = None
+
+try:
+    import lz4  # noqa: F401
+    SAVE_COMPRESSION = ('lz4', 3)
+except ImportError:  # lz4 is optional; zlib ships with Python
+    SAVE_COMPRESSION = ('zlib', 3)
+
+# Below this many rows, worker startup costs more than it saves
+PARALLEL_MIN_SAMPLES = 256
+
+# Rows per SHAP call when streaming |SHAP| sums (bounds peak memory)
+STREAM_CHUNK_SIZE = 512
+
+# AQI category upper bounds (inclusive) and their labels, for np.searchsorted lookup
+_AQI_CUTS = np.array([50, 100, 150, 200, 300])
+_AQI_CATS = ("Good", "Moderate", "Unhealthy for Sensitive Groups", "Unhealthy", "Very Unhealthy", "Hazardous")
+_AQI_EMOJI = ("✅", "⚠️", "🟠", "🔴", "🟣", "⚫")
+
+# XGBoost objectives whose raw margin is the prediction (SHAP values sum to it)
+_IDENTITY_LINK_OBJECTIVES = {
+    'reg:squarederror', 'reg:squaredlogerror', 'reg:absoluteerror',
+    'reg:pseudohubererror', 'reg:quantileerror', 'reg:linear'
+}
+
+# Built tree explainers keyed by model fingerprint, reused across load() calls
+EXPLAINER_CACHE_SIZE = 8
+_EXPLAINER_CACHE: "OrderedDict[str, object]" = OrderedDict()
+
+# Model families supported by TreeExplainer
+_TREE_MODEL_MODULES = ('xgboost', 'lightgbm', 'catboost')
+_FASTTREESHAP_MODULES = ('xgboost', 'lightgbm')
+_SKLEARN_TREE_MODELS = {
+    'DecisionTreeRegressor', 'DecisionTreeClassifier',
+    'RandomForestRegressor', 'RandomForestClassifier',
+    'ExtraTreesRegressor', 'ExtraTreesClassifier',
+    'GradientBoostingRegressor', 'GradientBoostingClassifier'
+}
+
+
+def _sum_abs_shap(shap_values_fn, X: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Sum |SHAP| per feature over X, one chunk at a time
+    
+    Args:
+        shap_values_fn: Callable returning SHAP values for a 2D array
+        X: Input data (2D array)
+        **kwargs: Extra arguments for shap_values_fn
+    
+    Returns:
+        Array of shape (n_features,) with summed absolute SHAP values
+    """
+    acc = np.zeros(X.shape[1], dtype=np.float64)
+    for chunk in np.array_split(X, max(1, len(X) // STREAM_CHUNK_SIZE)):
+        acc += np.abs(shap_values_fn(chunk, **kwargs)).sum(axis=0)
+    
+    return acc
+
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, in descending order (O(n) selection via argpartition)"""
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    top_idx = np.argpartition(values, -k)[-k:]
+    return top_idx[np.argsort(-values[top_idx], kind='stable')]
+
+
+def _model_fingerprint(model) -> Optional[str]:
+    """SHA-1 of the serialized XGBoost booster, or None for other models"""
+    if xgb is None:
+        return None
+    
+    if isinstance(model, xgb.Booster):
+        booster = model
+    elif isinstance(model, xgb.XGBModel):
+        booster = model.get_booster()
+    else:
+        return None
+    
+    return hashlib.sha1(booster.save_raw()).hexdigest()
+
+
+def _cache_explainer(model_fp: str, explainer) -> None:
+    """Remember a built explainer, evicting the least recently used beyond the cache size"""
+    _EXPLAINER_CACHE[model_fp] = explainer
+    _EXPLAINER_CACHE.move_to_end(model_fp)
+    if len(_EXPLAINER_CACHE) > EXPLAINER_CACHE_SIZE:
+        _EXPLAINER_CACHE.popitem(last=False)
+
+
+def _is_tree_model(model) -> bool:
+    """Check whether a model is a tree ensemble TreeExplainer can handle"""
+    model_type = type(model)
+    
+    if model_type.__module__.split('.')[0] in _TREE_MODEL_MODULES:
+        return True
+    
+    return model_type.__module__.startswith('sklearn.') and model_type.__name__ in _SKLEARN_TREE_MODELS
+
 
 class SHAPExplainer:
     """
     SHAP-based explainability for AQI predictions
     """
     
-    def __init__(self, model, feature_names: List[str], background_data: np.ndarray = None):
+    __slots__ = (
+        "model", "feature_names", "background_data", "explainer", "base_value",
+        "_rng", "_tree_limit", "_bg", "_use_gpu_treeshap", "_shap_kwargs", "_compute_raw",
+        "_linear_link"
+    )
+    
+    def __init__(self, model, feature_names: List[str], background_data: np.ndarray = None,
+                 explainer=None):
         """
         Initialize SHAP explainer
         
@@ -26,148 +148,382 @@ class SHAPExplainer:
             model: Trained XGBoost model
             feature_names: List of feature names
             background_data: Background dataset for SHAP (optional)
+            explainer: Already-built tree explainer for this model to reuse (optional)
         """
         self.model = model
         self.feature_names = feature_names
-        self.background_data = background_data
+        self.background_data = None if background_data is None else self._prep(background_data)
+        self._bg = None
         self.explainer = None
         self.base_value = None
+        self._use_gpu_treeshap = False
+        self._rng = np.random.default_rng(42)
+        self._tree_limit = self._model_tree_limit()
+        self._linear_link = self._has_identity_link()
+        self._shap_kwargs = {}
         
         # Initialize explainer
-        self._initialize_explainer()
+        self._initialize_explainer(explainer)
     
-    def _initialize_explainer(self):
-        """Initialize SHAP TreeExplainer"""
-        try:
+    def _initialize_explainer(self, explainer=None):
+        """Initialize SHAP explainer (TreeExplainer for tree models, KernelExplainer otherwise)"""
+        self._use_gpu_treeshap = self._gpu_treeshap_available()
+        
+        # Per-instance cache of raw SHAP output, rebuilt whenever the explainer is (re)initialized
+        self._compute_raw = lru_cache(maxsize=256)(self._compute_raw_uncached)
+        
+        if _is_tree_model(self.model):
             # For tree-based models, TreeExplainer is fastest
-            self.explainer = shap.TreeExplainer(self.model)
+            self.explainer = explainer if explainer is not None else self._build_tree_explainer()
             
-            # Get base value (average prediction)
-            if self.background_data is not None:
-                self.base_value = self.explainer.expected_value
-            else:
-                self.base_value = self.explainer.expected_value
-                
-            print(f"✓ SHAP explainer initialized (base value: {self.base_value:.2f})")
+            # Skip the additivity verification pass (set SHAP_CHECK_ADDITIVITY=1 to debug)
+            self._shap_kwargs = {
+                'check_additivity': os.getenv('SHAP_CHECK_ADDITIVITY', '0') == '1',
+                'tree_limit': self._tree_limit
+            }
             
-        except Exception as e:
-            print(f"⚠️ TreeExplainer failed, using KernelExplainer: {e}")
+        else:
+            # KernelExplainer is slower but works with any model
+            if self.background_data is None:
+                raise ValueError("background_data is required to explain non-tree models")
             
-            # Fallback to KernelExplainer (slower but works with any model)
-            if self.background_data is not None:
-                background = shap.sample(self.background_data, 100)
-            else:
-                # Use model's training data if available
-                background = None
+            # Subsample the background once and drop the full table
+            self._bg = shap.sample(self.background_data, 100, random_state=0)
+            self.background_data = None
             
             self.explainer = shap.KernelExplainer(
                 self.model.predict, 
-                background
+                self._bg
             )
-            self.base_value = background.mean() if background is not None else 0
+        
+        # Get base value (average prediction), coerced once to a float
+        ev = self.explainer.expected_value
+        self.base_value = float(ev[0]) if hasattr(ev, "__len__") else float(ev)
+        
+        print(f"✓ SHAP explainer initialized (base value: {self.base_value:.2f})")
+    
+    def _reusable_fingerprint(self) -> Optional[str]:
+        """Model fingerprint when the tree explainer depends on the model alone, else None"""
+        if self.background_data is not None or self._bg is not None:
+            return None
+        
+        return _model_fingerprint(self.model)
     
-    def explain_prediction(self, X: np.ndarray, feature_names: List[str] = None) -> Dict:
+    def _has_identity_link(self) -> bool:
+        """Check whether TreeSHAP output sums to the model's prediction (identity link)"""
+        if not _is_tree_model(self.model):
+            return False
+        
+        if xgb is not None and isinstance(self.model, (xgb.Booster, xgb.XGBModel)):
+            if isinstance(self.model, xgb.Booster):
+                objective = json.loads(self.model.save_config())['learner']['objective']['name']
+            else:
+                objective = self.model.get_xgb_params().get('objective') or 'reg:squarederror'
+            return isinstance(objective, str) and objective in _IDENTITY_LINK_OBJECTIVES
+        
+        # sklearn tree regressors explain the raw regression output
+        return type(self.model).__module__.startswith('sklearn.') and type(self.model).__name__.endswith('Regressor')
+    
+    def _explainer_base(self) -> float:
+        """
+        Base value the last SHAP call decomposed against
+        
+        TreeExplainer replaces its initial tree-cover estimate of expected_value with
+        XGBoost's exact bias term once shap_values has run, so read it after the call.
+        """
+        return float(np.ravel(self.explainer.expected_value)[0])
+    
+    def _model_tree_limit(self) -> Optional[int]:
+        """Number of trees used at inference (early-stopping best iteration), if any"""
+        tree_limit = getattr(self.model, 'best_ntree_limit', None)
+        if tree_limit is None:
+            try:
+                tree_limit = self.model.best_iteration + 1
+            except (AttributeError, TypeError):
+                return None
+        
+        return tree_limit
+    
+    def _build_tree_explainer(self):
+        """
+        Build the tree explainer
+        
+        XGBoost/LightGBM models use fasttreeshap.TreeExplainer with algorithm="v2"
+        when fasttreeshap is installed and no background data is given; v2
+        precomputes per-tree state once and reuses it across samples.
+        SHAP_TREE_BACKEND=shap forces stock SHAP, =fasttreeshap forces FastTreeSHAP.
+        """
+        backend = os.getenv('SHAP_TREE_BACKEND', 'auto').lower()
+        
+        if backend == 'fasttreeshap' or (
+            backend == 'auto'
+            and fasttreeshap is not None
+            and self.background_data is None
+            and type(self.model).__module__.split('.')[0] in _FASTTREESHAP_MODULES
+        ):
+            if fasttreeshap is None:
+                raise ImportError("SHAP_TREE_BACKEND=fasttreeshap requires the fasttreeshap package")
+            return fasttreeshap.TreeExplainer(self.model, algorithm='v2', shortcut=False, n_jobs=-1)
+        
+        if self.background_data is None:
+            return shap.TreeExplainer(self.model, feature_perturbation='tree_path_dependent')
+        
+        return shap.TreeExplainer(self.model)
+    
+    def _gpu_treeshap_available(self) -> bool:
+        """Check for an XGBoost model and a CUDA-enabled XGBoost build with a visible GPU"""
+        if xgb is None:
+            return False
+        
+        if not (isinstance(self.model, xgb.Booster) or hasattr(self.model, 'get_booster')):
+            return False
+        
+        try:
+            if not xgb.build_info().get('USE_CUDA', False):
+                return False
+            
+            import cupy
+            return cupy.cuda.runtime.getDeviceCount() > 0
+        except Exception:
+            return False
+    
+    def _shap_values_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute SHAP values for a batch, using XGBoost's GPUTreeShap when available
+        
+        Args:
+            X: Input data (2D array)
+        
+        Returns:
+            SHAP values array of shape (n_samples, n_features)
+        """
+        return self._shap_values_with_base(X)[0]
+    
+    def _shap_values_with_base(self, X: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Compute SHAP values for a batch together with the base value they decompose against
+        
+        Args:
+            X: Input data (2D array)
+        
+        Returns:
+            Tuple of (SHAP values array of shape (n_samples, n_features), base value)
+        """
+        if not self._use_gpu_treeshap:
+            shap_values = self.explainer.shap_values(X, **self._shap_kwargs)
+            self.base_value = self._explainer_base()
+            return shap_values, self.base_value
+        
+        booster = self.model if isinstance(self.model, xgb.Booster) else self.model.get_booster()
+        predict_kwargs = {'iteration_range': (0, self._tree_limit)} if self._tree_limit else {}
+        
+        device = json.loads(booster.save_config())['learner']['generic_param'].get('device', 'cpu')
+        booster.set_param({'device': 'cuda'})
+        try:
+            contribs = booster.predict(
+                xgb.DMatrix(X),
+                pred_contribs=True,
+                validate_features=False,
+                **predict_kwargs
+            )
+        finally:
+            booster.set_param({'device': device})
+        
+        # Last column is the bias term (expected value), the same for every row
+        if len(contribs):
+            self.base_value = float(contribs[0, -1])
+        return contribs[:, :-1], self.base_value
+    
+    def _compute_raw_uncached(self, x_bytes: bytes, shape: Tuple[int, ...]) -> Tuple[np.ndarray, float, float]:
+        """
+        Compute SHAP values and prediction for a serialized input
+        
+        Args:
+            x_bytes: float32 input array bytes (hashable cache key)
+            shape: Shape of the input array
+        
+        Returns:
+            Tuple of (SHAP values, prediction, base value)
+        """
+        X = np.frombuffer(x_bytes, dtype=np.float32).reshape(shape)
+        shap_values = self.explainer.shap_values(X, **self._shap_kwargs)
+        self.base_value = base = self._explainer_base()
+        
+        # With an identity link, base value + SHAP values is the prediction (no second tree pass)
+        if self._linear_link:
+            return shap_values, base + float(np.sum(shap_values[0], dtype=np.float64)), base
+        
+        return shap_values, float(self.model.predict(X)[0]), base
+    
+    @staticmethod
+    def _prep(X) -> np.ndarray:
+        """Convert input to a 2D C-contiguous float32 array (the dtype XGBoost uses internally)"""
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X[None, :]
+        
+        return np.ascontiguousarray(X, dtype=np.float32)
+    
+    def explain_prediction(self, X: np.ndarray, feature_names: List[str] = None,
+                           max_contributions: int = 10) -> Dict:
         """
         Generate SHAP explanation for a single prediction
         
         Args:
             X: Input features (1D or 2D array)
             feature_names: Optional custom feature names
+            max_contributions: Number of largest |SHAP| features kept in feature_contributions
         
         Returns:
             Dictionary with explanation data
         """
-        # Ensure 2D input
-        if len(X.shape) == 1:
-            X = X.reshape(1, -1)
-        
-        # Get SHAP values
-        shap_values = self.explainer.shap_values(X)
+        X = self._prep(X)
         
-        # Get prediction
-        prediction = float(self.model.predict(X)[0])
+        # Get SHAP values, prediction and base value (cached per input)
+        shap_values, prediction, base = self._compute_raw(X.tobytes(), X.shape)
         
         # Use provided feature names or default
         features = feature_names if feature_names else self.feature_names
         
-        # Create explanation dictionary
-        explanation = {
-            'prediction': prediction,
-            'base_value': float(self.base_value),
-            'shap_values': {},
-            'feature_contributions': {},
-            'top_positive_features': [],
-            'top_negative_features': []
-        }
-        
         # Extract SHAP values for features
         shap_vals = shap_values[0] if len(shap_values.shape) > 1 else shap_values
         
-        for i, feature in enumerate(features):
+        return self._build_explanation(
+            np.asarray(shap_vals, dtype=np.float32), X[0], prediction, base, features, max_contributions
+        )
+    
+    def explain_predictions(self, X: np.ndarray, feature_names: List[str] = None,
+                            max_contributions: int = 10) -> List[Dict]:
+        """
+        Generate SHAP explanations for a batch of predictions
+        
+        Args:
+            X: Input features (2D array)
+            feature_names: Optional custom feature names
+            max_contributions: Number of largest |SHAP| features kept in feature_contributions
+        
+        Returns:
+            List of explanation dictionaries, one per row
+        """
+        X = self._prep(X)
+        
+        # One SHAP call and one predict call for the whole batch
+        shap_values, base = self._shap_values_with_base(X)
+        if self._linear_link:
+            predictions = (base + np.sum(shap_values, axis=1, dtype=np.float64)).tolist()
+        else:
+            predictions = np.asarray(self.model.predict(X), dtype=float).tolist()
+        shap_mat = np.asarray(shap_values, dtype=np.float32)
+        
+        # Use provided feature names or default
+        features = feature_names if feature_names else self.feature_names
+        
+        build = self._build_explanation
+        
+        return [
+            build(shap_mat[i], X[i], predictions[i], base, features, max_contributions)
+            for i in range(len(X))
+        ]
+    
+    def _build_explanation(self, shap_vals: np.ndarray, xrow: np.ndarray, prediction: float,
+                           base_value: float, features: List[str], max_contributions: int) -> Dict:
+        """
+        Assemble the explanation dictionary for one row
+        
+        Args:
+            shap_vals: SHAP values for the row (1D float32 array)
+            xrow: Feature values for the row (1D array)
+            prediction: Model prediction for the row
+            base_value: Base value the SHAP values decompose against
+            features: Feature names
+            max_contributions: Number of largest |SHAP| features kept in feature_contributions
+        
+        Returns:
+            Dictionary with explanation data
+        """
+        # Select top features by absolute SHAP value, split into positive / negative contributors
+        abs_shap = np.abs(shap_vals)
+        pos_idx = np.flatnonzero(shap_vals > 0)
+        neg_idx = np.flatnonzero(shap_vals <= 0)
+        
+        def _top(indices):
+            top_idx = indices[_top_k_indices(abs_shap[indices], 5)]
+            return [
+                {'feature': features[i], 'shap_value': float(shap_vals[i]), 'feature_value': float(xrow[i])}
+                for i in top_idx
+            ]
+        
+        # Only the largest contributors are materialized as verbose dicts
+        feature_contributions = {}
+        for i in _top_k_indices(abs_shap, max_contributions):
             shap_val = float(shap_vals[i])
-            feature_val = float(X[0, i])
-            
-            explanation['shap_values'][feature] = shap_val
-            explanation['feature_contributions'][feature] = {
-                'value': feature_val,
+            feature_contributions[features[i]] = {
+                'value': float(xrow[i]),
                 'shap_value': shap_val,
                 'contribution': 'positive' if shap_val > 0 else 'negative',
                 'impact': abs(shap_val)
             }
         
-        # Sort by absolute SHAP value
-        sorted_features = sorted(
-            explanation['feature_contributions'].items(),
-            key=lambda x: abs(x[1]['shap_value']),
-            reverse=True
-        )
+        # Create explanation dictionary
+        explanation = {
+            'prediction': prediction,
+            'base_value': base_value,
+            'shap_values': dict(zip(features, shap_vals.tolist())),
+            'feature_contributions': feature_contributions,
+            'top_positive_features': _top(pos_idx),
+            'top_negative_features': _top(neg_idx)
+        }
         
-        # Get top positive and negative contributors
-        for feature, data in sorted_features:
-            if data['shap_value'] > 0:
-                explanation['top_positive_features'].append({
-                    'feature': feature,
-                    'shap_value': data['shap_value'],
-                    'feature_value': data['value']
-                })
-            else:
-                explanation['top_negative_features'].append({
-                    'feature': feature,
-                    'shap_value': data['shap_value'],
-                    'feature_value': data['value']
-                })
+        return explanation
+    
+    def _mean_abs_shap(self, X: np.ndarray, n_jobs: int = -1) -> np.ndarray:
+        """
+        Compute mean |SHAP| per feature without materializing the full SHAP matrix
         
-        # Limit to top 5 each
-        explanation['top_positive_features'] = explanation['top_positive_features'][:5]
-        explanation['top_negative_features'] = explanation['top_negative_features'][:5]
+        Args:
+            X: Input data (2D array)
+            n_jobs: Number of joblib workers (-1 uses all cores)
         
-        return explanation
+        Returns:
+            Array of shape (n_features,) with mean absolute SHAP values
+        """
+        if self._use_gpu_treeshap or n_jobs == 1 or len(X) < PARALLEL_MIN_SAMPLES:
+            return _sum_abs_shap(self._shap_values_batch, X) / len(X)
+        
+        parts = np.array_split(X, max(1, os.cpu_count() or 1))
+        sums = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_sum_abs_shap)(self.explainer.shap_values, part, **self._shap_kwargs)
+            for part in parts if len(part)
+        )
+        
+        return np.sum(sums, axis=0) / len(X)
     
-    def get_global_feature_importance(self, X: np.ndarray, max_samples: int = 1000) -> pd.DataFrame:
+    def get_global_feature_importance(self, X: np.ndarray, max_samples: int = 1000,
+                                      n_jobs: int = -1) -> pd.DataFrame:
         """
         Calculate global feature importance using SHAP
         
         Args:
             X: Input data (2D array)
             max_samples: Maximum samples to use for calculation
+            n_jobs: Number of joblib workers for SHAP computation (-1 uses all cores)
         
         Returns:
             DataFrame with feature importance
         """
+        X = self._prep(X)
+        
         # Limit samples for performance
         if len(X) > max_samples:
-            indices = np.random.choice(len(X), max_samples, replace=False)
+            indices = self._rng.choice(len(X), max_samples, replace=False, shuffle=False)
             X_sample = X[indices]
         else:
             X_sample = X
         
         print(f"Calculating SHAP values for {len(X_sample)} samples...")
         
-        # Get SHAP values
-        shap_values = self.explainer.shap_values(X_sample)
-        
         # Calculate mean absolute SHAP value for each feature
-        mean_abs_shap = np.abs(shap_values).mean(axis=0)
+        mean_abs_shap = self._mean_abs_shap(X_sample, n_jobs=n_jobs)
         
         # Create importance dataframe
         importance_df = pd.DataFrame({
@@ -193,15 +549,17 @@ class SHAPExplainer:
         Returns:
             Dictionary with SHAP values and summary statistics
         """
+        X = self._prep(X)
+        
         if n_samples:
             X = X[:n_samples]
         
         print(f"Generating SHAP values for {len(X)} samples...")
-        shap_values = self.explainer.shap_values(X)
+        shap_values, base = self._shap_values_with_base(X)
         
         return {
             'shap_values': shap_values,
-            'base_value': self.base_value,
+            'base_value': base,
             'feature_names': self.feature_names,
             'n_samples': len(X)
         }
@@ -217,52 +575,47 @@ class SHAPExplainer:
         Returns:
             Dictionary with waterfall plot data
         """
-        explanation = self.explain_prediction(X)
-        
-        # Sort all features by absolute SHAP value
-        all_features = []
-        for feature, data in explanation['feature_contributions'].items():
-            all_features.append({
-                'feature': feature,
-                'shap_value': data['shap_value'],
-                'feature_value': data['value']
-            })
+        X = self._prep(X)
+        explanation = self.explain_prediction(X, max_contributions=max_features)
+        
+        # Features arrive already sorted by absolute SHAP value
+        top_features = list(explanation['feature_contributions'].items())[:max_features]
+        names = [feature for feature, _ in top_features]
+        values = [data['value'] for _, data in top_features]
+        shap_arr = np.fromiter(
+            (data['shap_value'] for _, data in top_features), dtype=np.float64, count=len(top_features)
+        )
         
-        all_features.sort(key=lambda x: abs(x['shap_value']), reverse=True)
+        base = explanation['base_value']
         
-        # Take top features
-        top_features = all_features[:max_features]
+        # Add "other features" if needed
+        other_shap = explanation['prediction'] - (base + shap_arr.sum())
+        if abs(other_shap) > 0.01:
+            names.append('Other features')
+            values.append(None)
+            shap_arr = np.append(shap_arr, other_shap)
         
         # Calculate cumulative values for waterfall
+        cum_after = base + np.cumsum(shap_arr)
+        cum_before = np.concatenate(([base], cum_after[:-1]))
+        
         waterfall_data = {
-            'base_value': explanation['base_value'],
+            'base_value': base,
             'prediction': explanation['prediction'],
-            'features': []
+            'features': [
+                {
+                    'name': name,
+                    'value': value,
+                    'shap_value': shap_value,
+                    'cumulative_before': before,
+                    'cumulative_after': after
+                }
+                for name, value, shap_value, before, after in zip(
+                    names, values, shap_arr.tolist(), cum_before.tolist(), cum_after.tolist()
+                )
+            ]
         }
         
-        cumulative = explanation['base_value']
-        
-        for item in top_features:
-            waterfall_data['features'].append({
-                'name': item['feature'],
-                'value': item['feature_value'],
-                'shap_value': item['shap_value'],
-                'cumulative_before': cumulative,
-                'cumulative_after': cumulative + item['shap_value']
-            })
-            cumulative += item['shap_value']
-        
-        # Add "other features" if needed
-        other_shap = explanation['prediction'] - cumulative
-        if abs(other_shap) > 0.01:
-            waterfall_data['features'].append({
-                'name': 'Other features',
-                'value': None,
-                'shap_value': other_shap,
-                'cumulative_before': cumulative,
-                'cumulative_after': cumulative + other_shap
-            })
-        
         return waterfall_data
     
     def save(self, save_path: Path):
@@ -273,11 +626,14 @@ class SHAPExplainer:
         explainer_data = {
             'feature_names': self.feature_names,
             'base_value': self.base_value,
-            'background_data': self.background_data
+            'background_data': self._bg if self._bg is not None else self.background_data,
+            'model_fp': self._reusable_fingerprint()
         }
         
-        with open(save_path, 'wb') as f:
-            pickle.dump(explainer_data, f)
+        if explainer_data['model_fp'] is not None:
+            _cache_explainer(explainer_data['model_fp'], self.explainer)
+        
+        joblib.dump(explainer_data, save_path, compress=SAVE_COMPRESSION)
         
         print(f"✓ SHAP explainer saved to {save_path}")
     
@@ -286,14 +642,29 @@ class SHAPExplainer:
         """Load explainer from disk"""
         load_path = Path(load_path)
         
-        with open(load_path, 'rb') as f:
-            explainer_data = pickle.load(f)
-        
-        return cls(
+        try:
+            explainer_data = joblib.load(load_path)
+        except Exception:
+            # Explainers saved before the switch to joblib are plain pickles
+            with open(load_path, 'rb') as f:
+                explainer_data = pickle.load(f)
+        
+        # Reuse an explainer already built in this process for the same model
+        saved_fp = explainer_data.get('model_fp')
+        model_fp = _model_fingerprint(model) if saved_fp is not None else None
+        explainer = _EXPLAINER_CACHE.get(model_fp) if model_fp == saved_fp else None
+        
+        loaded = cls(
             model=model,
             feature_names=explainer_data['feature_names'],
-            background_data=explainer_data.get('background_data')
+            background_data=explainer_data.get('background_data'),
+            explainer=explainer
         )
+        
+        if model_fp is not None and model_fp == saved_fp:
+            _cache_explainer(model_fp, loaded.explainer)
+        
+        return loaded
 
 
 def create_feature_importance_chart_data(importance_df: pd.DataFrame, top_n: int = 15) -> Dict:
@@ -309,10 +680,13 @@ def create_feature_importance_chart_data(importance_df: pd.DataFrame, top_n: int
     """
     top_features = importance_df.head(top_n)
     
+    # Materialize both numeric columns in a single float block
+    values = top_features[['importance', 'importance_pct']].to_numpy(dtype=float)
+    
     return {
         'features': top_features['feature'].tolist(),
-        'importance': top_features['importance'].tolist(),
-        'importance_pct': top_features['importance_pct'].tolist()
+        'importance': values[:, 0].tolist(),
+        'importance_pct': values[:, 1].tolist()
     }
 
 
@@ -328,25 +702,35 @@ def explain_aqi_category(aqi_value: float, shap_explanation: Dict) -> str:
         Human-readable explanation string
     """
     # Determine category
-    if aqi_value <= 50:
-        category = "Good"
-        emoji = "✅"
-    elif aqi_value <= 100:
-        category = "Moderate"
-        emoji = "⚠️"
-    elif aqi_value <= 150:
-        category = "Unhealthy for Sensitive Groups"
-        emoji = "🟠"
-    elif aqi_value <= 200:
-        category = "Unhealthy"
-        emoji = "🔴"
-    elif aqi_value <= 300:
-        category = "Very Unhealthy"
-        emoji = "🟣"
-    else:
-        category = "Hazardous"
-        emoji = "⚫"
+    idx = int(np.searchsorted(_AQI_CUTS, aqi_value))
     
+    return _format_aqi_explanation(aqi_value, _AQI_CATS[idx], _AQI_EMOJI[idx], shap_explanation)
+
+
+def batch_explain_aqi_category(aqi_values: np.ndarray, shap_explanations: List[Dict]) -> List[str]:
+    """
+    Generate human-readable explanations for a batch of AQI predictions
+    
+    Args:
+        aqi_values: Predicted AQI values
+        shap_explanations: SHAP explanation dictionary for each prediction
+    
+    Returns:
+        List of human-readable explanation strings
+    """
+    aqi_values = np.asarray(aqi_values, dtype=float)
+    
+    # Determine all categories at once
+    indices = np.searchsorted(_AQI_CUTS, aqi_values).tolist()
+    
+    return [
+        _format_aqi_explanation(aqi_value, _AQI_CATS[idx], _AQI_EMOJI[idx], shap_explanation)
+        for aqi_value, idx, shap_explanation in zip(aqi_values.tolist(), indices, shap_explanations)
+    ]
+
+
+def _format_aqi_explanation(aqi_value: float, category: str, emoji: str, shap_explanation: Dict) -> str:
+    """Format the explanation text for one prediction"""
     # Get top contributors
     top_pos = shap_explanation['top_positive_features'][:3]
     top_neg = shap_explanation['top_negative_features'][:3]
@@ -364,4 +748,4 @@ def explain_aqi_category(aqi_value: float, shap_explanation: Dict) -> str:
         for feat in top_neg:
             explanation += f"• {feat['feature'].replace('_', ' ').title()}: {feat['feature_value']:.2f} ({feat['shap_value']:.2f})\n"
     
-    return explanation
\ No newline at end of file
+    return explanation
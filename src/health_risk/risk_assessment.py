@@ -4,9 +4,83 @@ Provides personalized health risk assessments based on AQI
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Sequence, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional JIT kernel for bulk scoring
+    njit = None
+
+
+# Rows above which assess_health_risk_frame categorizes with the numba kernel
+NUMBA_MIN_ROWS = 10_000
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _assess_kernel(aqi, bp, unknown):
+        """Category index per AQI value (unknown for NaN or negative AQI)"""
+        n = aqi.shape[0]
+        cat = np.empty(n, np.int8)
+        last = bp.shape[0] - 1
+        for i in prange(n):
+            a = aqi[i]
+            if not a >= 0:
+                cat[i] = unknown
+                continue
+            idx = 0
+            while idx < last and a > bp[idx]:
+                idx += 1
+            cat[i] = idx
+        return cat
+else:
+    _assess_kernel = None
+
+
+# Recommendation texts per category; _REC_VUL_* are added for vulnerable people
+_REC_GOOD = ("Enjoy outdoor activities!", "No precautions needed")
+_REC_MODERATE = ("Outdoor activities are generally safe", "Sensitive individuals should watch for symptoms")
+_REC_MODERATE_VULNERABLE = (
+    "Consider reducing prolonged outdoor exertion",
+    "Watch for symptoms like coughing or shortness of breath"
+)
+_REC_UNHEALTHY_SENSITIVE = (
+    "Sensitive groups should reduce prolonged outdoor exertion",
+    "Keep windows closed to reduce indoor pollution"
+)
+_REC_VUL_UNHEALTHY_SENSITIVE = (
+    "Consider moving activities indoors",
+    "Have quick-relief medication readily available (if applicable)"
+)
+_REC_UNHEALTHY = (
+    "Everyone should reduce prolonged outdoor exertion",
+    "Sensitive groups should avoid prolonged outdoor exertion",
+    "Keep windows closed",
+    "Use air purifiers indoors if available"
+)
+_REC_VUL_UNHEALTHY = ("Stay indoors as much as possible",)
+_REC_VERY_UNHEALTHY = (
+    "Everyone should avoid prolonged outdoor exertion",
+    "Sensitive groups should remain indoors",
+    "Keep windows and doors closed",
+    "Use HEPA air purifiers",
+    "Postpone outdoor activities"
+)
+_REC_HAZARDOUS = (
+    "STAY INDOORS - Emergency conditions",
+    "Keep all windows and doors closed",
+    "Run air purifiers continuously",
+    "Avoid all outdoor activities",
+    "Vulnerable individuals should seek medical advice",
+    "Use N95/N99 masks if you must go outside"
+)
+
+# Average-exposure upper bounds (inclusive) and their labels
+EXPOSURE_BREAKPOINTS = np.array([50, 100, 150])
+EXPOSURE_CATEGORIES = ('Low', 'Moderate', 'High', 'Very High')
 
 
 class AQICategory(Enum):
@@ -28,14 +102,14 @@ class RiskLevel(Enum):
     EXTREME = "Extreme"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthRiskAssessment:
     """Health risk assessment result"""
     aqi: float
     aqi_category: str
     risk_level: str
     health_message: str
-    recommendations: List[str]
+    recommendations: Sequence[str]
     vulnerable_group_warnings: Dict[str, str]
     outdoor_activity_level: str
     mask_recommendation: str
@@ -44,26 +118,164 @@ class HealthRiskAssessment:
 class HealthRiskCalculator:
     """Calculate health risks based on AQI and demographics"""
     
+    # Category labels and health messages by category index (last entry: undetermined AQI)
+    _CAT_LABELS = (
+        "Good", "Moderate", "Unhealthy for Sensitive Groups", "Unhealthy", "Very Unhealthy", "Hazardous", "Unknown"
+    )
+    _HEALTH_MESSAGES = (
+        "Air quality is satisfactory, and air pollution poses little or no risk.",
+        "Air quality is acceptable. However, there may be a risk for some people, particularly those who are unusually sensitive to air pollution.",
+        "Members of sensitive groups may experience health effects. The general public is less likely to be affected.",
+        "Some members of the general public may experience health effects; members of sensitive groups may experience more serious health effects.",
+        "Health alert: The risk of health effects is increased for everyone.",
+        "Health warning of emergency conditions: everyone is more likely to be affected.",
+        "Unable to determine health impact."
+    )
+    
+    # Risk level by [is_vulnerable][category index] (last column: undetermined AQI)
+    _RISK_TABLE = (
+        (RiskLevel.LOW, RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH,
+         RiskLevel.VERY_HIGH, RiskLevel.EXTREME, RiskLevel.EXTREME),
+        (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH, RiskLevel.VERY_HIGH,
+         RiskLevel.EXTREME, RiskLevel.EXTREME, RiskLevel.EXTREME)
+    )
+    
+    # Recommendations by [is_vulnerable][category index] (last column: undetermined AQI)
+    _REC_TABLE = (
+        (_REC_GOOD, _REC_MODERATE, _REC_UNHEALTHY_SENSITIVE, _REC_UNHEALTHY,
+         _REC_VERY_UNHEALTHY, _REC_HAZARDOUS, _REC_HAZARDOUS),
+        (_REC_GOOD, _REC_MODERATE_VULNERABLE, _REC_UNHEALTHY_SENSITIVE + _REC_VUL_UNHEALTHY_SENSITIVE,
+         _REC_UNHEALTHY + _REC_VUL_UNHEALTHY, _REC_VERY_UNHEALTHY, _REC_HAZARDOUS, _REC_HAZARDOUS)
+    )
+    
+    # Outdoor activity level by [is_vulnerable][category index] (last column: undetermined AQI)
+    _ACTIVITY_TABLE = (
+        ("Unrestricted", "Generally Safe", "Reduce Prolonged Exertion", "Avoid Prolonged Exertion",
+         "Minimize Outdoor Activity", "Stay Indoors - Emergency", "Stay Indoors - Emergency"),
+        ("Unrestricted", "Reduce Prolonged Exertion", "Avoid Prolonged Exertion", "Minimize Outdoor Activity",
+         "Stay Indoors", "Stay Indoors - Emergency", "Stay Indoors - Emergency")
+    )
+    
+    # Mask recommendation by category index (last column: undetermined AQI)
+    _MASK_TABLE = (
+        "Not necessary",
+        "Not necessary",
+        "Recommended for sensitive groups",
+        "N95 mask recommended for everyone outdoors",
+        "N95/N99 mask required if going outdoors",
+        "N95/N99 mask required if going outdoors",
+        "N95/N99 mask required if going outdoors"
+    )
+    
+    # Vulnerable group warnings per category index (last column: undetermined AQI)
+    _WARNINGS = {
+        'children': (
+            "", "",
+            "Children should reduce prolonged outdoor play. Watch for symptoms.",
+            "Children should avoid prolonged outdoor activities. Indoor play recommended.",
+            "Keep children indoors. Close schools may consider closure.",
+            "CRITICAL: Keep children indoors at all times. Schools should close.",
+            ""
+        ),
+        'elderly': (
+            "", "",
+            "Seniors should limit time outdoors and reduce exertion.",
+            "Seniors should stay indoors and minimize physical activity.",
+            "Seniors must stay indoors. Monitor for chest pain or breathing difficulty.",
+            "CRITICAL: Seniors should remain indoors. Seek medical help if needed.",
+            ""
+        ),
+        'pregnant_women': (
+            "", "",
+            "Limit outdoor exposure to protect fetal health.",
+            "Avoid outdoor activities. Indoor rest recommended.",
+            "Stay indoors. High pollution may affect pregnancy.",
+            "CRITICAL: Remain indoors. Consult doctor if experiencing symptoms.",
+            ""
+        ),
+        'asthma_patients': (
+            "", "",
+            "Have quick-relief inhaler ready. Reduce outdoor activities.",
+            "High risk of asthma attacks. Stay indoors. Keep medication close.",
+            "SEVERE RISK: Stay indoors. Monitor symptoms closely. Have emergency plan ready.",
+            "CRITICAL: Extreme asthma risk. Stay indoors. Seek emergency care if symptoms worsen.",
+            ""
+        ),
+        'heart_disease_patients': (
+            "", "",
+            "Reduce physical exertion. Monitor for chest discomfort.",
+            "Avoid all outdoor activities. Rest indoors. Watch for symptoms.",
+            "HIGH RISK: Stay indoors. Seek medical attention if experiencing chest pain.",
+            "CRITICAL: Cardiovascular emergency risk. Stay indoors. Call doctor if symptoms appear.",
+            ""
+        ),
+        'copd_patients': (
+            "", "",
+            "Use medications as prescribed. Limit outdoor exposure.",
+            "High risk of exacerbation. Stay indoors. Keep oxygen therapy ready if applicable.",
+            "SEVERE RISK: Stay indoors. Monitor oxygen levels. Have emergency plan.",
+            "CRITICAL: Extreme risk of respiratory failure. Stay indoors. Seek immediate care if worsening.",
+            ""
+        ),
+        'athletes': (
+            "", "",
+            "Reduce intensity and duration of outdoor training.",
+            "Move training indoors. High-intensity exercise is risky.",
+            "Cancel outdoor training. Indoor low-intensity only.",
+            "CRITICAL: No training. Rest and recovery mode.",
+            ""
+        )
+    }
+    
+    # Bit per vulnerable group, so group selections can be passed around as small integer masks
+    _GROUP_BIT = {
+        'children': 1,
+        'elderly': 2,
+        'pregnant_women': 4,
+        'asthma_patients': 8,
+        'heart_disease_patients': 16,
+        'copd_patients': 32,
+        'athletes': 64
+    }
+    _ALL_GROUPS = 127
+    
+    # Category index used for NaN, None or negative AQI
+    _UNKNOWN = 6
+    
     def __init__(self):
-        # AQI breakpoints (US EPA)
-        self.aqi_breakpoints = {
-            AQICategory.GOOD: (0, 50),
-            AQICategory.MODERATE: (51, 100),
-            AQICategory.UNHEALTHY_SENSITIVE: (101, 150),
-            AQICategory.UNHEALTHY: (151, 200),
-            AQICategory.VERY_UNHEALTHY: (201, 300),
-            AQICategory.HAZARDOUS: (301, 500)
-        }
+        # Category upper bounds for np.searchsorted lookup (AQI > 500 stays hazardous)
+        self._bp = np.array([50, 100, 150, 200, 300, 500], dtype=np.int32)
+        self._cats = (
+            AQICategory.GOOD,
+            AQICategory.MODERATE,
+            AQICategory.UNHEALTHY_SENSITIVE,
+            AQICategory.UNHEALTHY,
+            AQICategory.VERY_UNHEALTHY,
+            AQICategory.HAZARDOUS
+        )
         
-        # Color codes for visualization
-        self.aqi_colors = {
-            AQICategory.GOOD: "#00E400",
-            AQICategory.MODERATE: "#FFFF00",
-            AQICategory.UNHEALTHY_SENSITIVE: "#FF7E00",
-            AQICategory.UNHEALTHY: "#FF0000",
-            AQICategory.VERY_UNHEALTHY: "#8F3F97",
-            AQICategory.HAZARDOUS: "#7E0023"
-        }
+        # Object-array views of the lookup tables for vectorized (frame) assessment
+        self._category_labels = np.array(self._CAT_LABELS, dtype=object)
+        self._risk_labels = np.array([[r.value for r in row] for row in self._RISK_TABLE], dtype=object)
+        self._message_labels = np.array(self._HEALTH_MESSAGES, dtype=object)
+        self._activity_labels = np.array(self._ACTIVITY_TABLE, dtype=object)
+        self._mask_labels = np.array(self._MASK_TABLE, dtype=object)
+        self._rec_lists = np.empty((2, len(self._MASK_TABLE)), dtype=object)
+        for vul, row in enumerate(self._REC_TABLE):
+            for idx, recs in enumerate(row):
+                self._rec_lists[vul, idx] = recs
+        
+        # Vulnerable group warnings by [group, category index], groups in _WARNINGS order
+        self._warn_groups = tuple(self._WARNINGS)
+        self._warn_bits = tuple(self._GROUP_BIT[group] for group in self._warn_groups)
+        self._warn_table = np.array([self._WARNINGS[group] for group in self._warn_groups], dtype=object)
+        
+        # Assessments differ only by (category index, is_vulnerable): at most 14 entries.
+        # Cached lists/dicts are shared between results and must not be mutated.
+        self._assess_cached = lru_cache(maxsize=1024)(self._build_assessment)
+        
+        # Color codes for visualization, by category index (None for undetermined AQI)
+        self._colors = ('#00E400', '#FFFF00', '#FF7E00', '#FF0000', '#8F3F97', '#7E0023', None)
         
         # Vulnerable groups
         self.vulnerable_groups = [
@@ -76,197 +288,127 @@ class HealthRiskCalculator:
             'athletes'
         ]
     
+    def _category_index(self, aqi: float) -> int:
+        """Get category index (0-5) from AQI value, or _UNKNOWN when undetermined"""
+        # aqi != aqi is the NaN test; pd.NA makes the comparison itself raise TypeError
+        try:
+            if aqi is None or aqi != aqi or aqi < 0:
+                return self._UNKNOWN
+        except TypeError:
+            return self._UNKNOWN
+        
+        return min(int(np.searchsorted(self._bp, aqi, side='left')), 5)
+    
     def get_aqi_category(self, aqi: float) -> AQICategory:
         """Get AQI category from AQI value"""
-        if pd.isna(aqi):
-            return None
+        idx = self._category_index(aqi)
         
-        for category, (low, high) in self.aqi_breakpoints.items():
-            if low <= aqi <= high:
-                return category
+        return self._cats[idx] if idx != self._UNKNOWN else None
+    
+    def categorize_batch(self, aqi: np.ndarray) -> np.ndarray:
+        """
+        Map an array of AQI values to category indices in one pass
         
-        # If AQI > 500, still hazardous
-        if aqi > 500:
-            return AQICategory.HAZARDOUS
+        Args:
+            aqi: Array of AQI values
+            
+        Returns:
+            Integer array of indices into AQICategory order: _UNKNOWN (6) for NaN or
+            negative AQI, and Hazardous (5) for values above the top breakpoint
+        """
+        aqi = np.asarray(aqi, dtype=float)
+        idx = np.searchsorted(self._bp, aqi, side='left')
+        np.clip(idx, 0, 5, out=idx)
+        idx[~(aqi >= 0)] = self._UNKNOWN
+        
+        return idx
+    
+    def get_aqi_category_array(self, aqi: np.ndarray) -> np.ndarray:
+        """Get AQI categories for an array of AQI values (None where undetermined)"""
+        lookup = np.array(self._cats + (None,), dtype=object)
         
-        return None
+        return lookup[self.categorize_batch(aqi)]
     
     def get_risk_level(self, aqi: float, is_vulnerable: bool = False) -> RiskLevel:
         """Calculate risk level based on AQI and vulnerability"""
-        category = self.get_aqi_category(aqi)
-        
-        if category == AQICategory.GOOD:
-            return RiskLevel.LOW
-        elif category == AQICategory.MODERATE:
-            return RiskLevel.MODERATE if is_vulnerable else RiskLevel.LOW
-        elif category == AQICategory.UNHEALTHY_SENSITIVE:
-            return RiskLevel.HIGH if is_vulnerable else RiskLevel.MODERATE
-        elif category == AQICategory.UNHEALTHY:
-            return RiskLevel.VERY_HIGH if is_vulnerable else RiskLevel.HIGH
-        elif category == AQICategory.VERY_UNHEALTHY:
-            return RiskLevel.EXTREME if is_vulnerable else RiskLevel.VERY_HIGH
-        else:  # HAZARDOUS
-            return RiskLevel.EXTREME
+        return self._risk_for(self._category_index(aqi), bool(is_vulnerable))
     
     def get_health_message(self, aqi: float) -> str:
         """Get general health message for AQI level"""
-        category = self.get_aqi_category(aqi)
-        
-        messages = {
-            AQICategory.GOOD: "Air quality is satisfactory, and air pollution poses little or no risk.",
-            AQICategory.MODERATE: "Air quality is acceptable. However, there may be a risk for some people, particularly those who are unusually sensitive to air pollution.",
-            AQICategory.UNHEALTHY_SENSITIVE: "Members of sensitive groups may experience health effects. The general public is less likely to be affected.",
-            AQICategory.UNHEALTHY: "Some members of the general public may experience health effects; members of sensitive groups may experience more serious health effects.",
-            AQICategory.VERY_UNHEALTHY: "Health alert: The risk of health effects is increased for everyone.",
-            AQICategory.HAZARDOUS: "Health warning of emergency conditions: everyone is more likely to be affected."
-        }
-        
-        return messages.get(category, "Unable to determine health impact.")
+        return self._message_for(self._category_index(aqi))
     
-    def get_recommendations(self, aqi: float, is_vulnerable: bool = False) -> List[str]:
-        """Get personalized recommendations based on AQI"""
-        category = self.get_aqi_category(aqi)
-        recommendations = []
-        
-        if category == AQICategory.GOOD:
-            recommendations.append("Enjoy outdoor activities!")
-            recommendations.append("No precautions needed")
-        
-        elif category == AQICategory.MODERATE:
-            if is_vulnerable:
-                recommendations.append("Consider reducing prolonged outdoor exertion")
-                recommendations.append("Watch for symptoms like coughing or shortness of breath")
-            else:
-                recommendations.append("Outdoor activities are generally safe")
-                recommendations.append("Sensitive individuals should watch for symptoms")
-        
-        elif category == AQICategory.UNHEALTHY_SENSITIVE:
-            recommendations.append("Sensitive groups should reduce prolonged outdoor exertion")
-            recommendations.append("Keep windows closed to reduce indoor pollution")
-            if is_vulnerable:
-                recommendations.append("Consider moving activities indoors")
-                recommendations.append("Have quick-relief medication readily available (if applicable)")
-        
-        elif category == AQICategory.UNHEALTHY:
-            recommendations.append("Everyone should reduce prolonged outdoor exertion")
-            recommendations.append("Sensitive groups should avoid prolonged outdoor exertion")
-            recommendations.append("Keep windows closed")
-            recommendations.append("Use air purifiers indoors if available")
-            if is_vulnerable:
-                recommendations.append("Stay indoors as much as possible")
-        
-        elif category == AQICategory.VERY_UNHEALTHY:
-            recommendations.append("Everyone should avoid prolonged outdoor exertion")
-            recommendations.append("Sensitive groups should remain indoors")
-            recommendations.append("Keep windows and doors closed")
-            recommendations.append("Use HEPA air purifiers")
-            recommendations.append("Postpone outdoor activities")
-        
-        else:  # HAZARDOUS
-            recommendations.append("STAY INDOORS - Emergency conditions")
-            recommendations.append("Keep all windows and doors closed")
-            recommendations.append("Run air purifiers continuously")
-            recommendations.append("Avoid all outdoor activities")
-            recommendations.append("Vulnerable individuals should seek medical advice")
-            recommendations.append("Use N95/N99 masks if you must go outside")
-        
-        return recommendations
+    def color_for(self, aqi: float) -> str:
+        """Get the EPA display color for an AQI value"""
+        return self._colors[self._category_index(aqi)]
+    
+    def get_recommendations(self, aqi: float, is_vulnerable: bool = False) -> Sequence[str]:
+        """Get personalized recommendations based on AQI (shared tuple; copy before mutating)"""
+        return self._recs_for(self._category_index(aqi), bool(is_vulnerable))
     
     def get_outdoor_activity_level(self, aqi: float, is_vulnerable: bool = False) -> str:
         """Get outdoor activity recommendation"""
-        category = self.get_aqi_category(aqi)
-        
-        if category == AQICategory.GOOD:
-            return "Unrestricted"
-        elif category == AQICategory.MODERATE:
-            return "Generally Safe" if not is_vulnerable else "Reduce Prolonged Exertion"
-        elif category == AQICategory.UNHEALTHY_SENSITIVE:
-            return "Reduce Prolonged Exertion" if not is_vulnerable else "Avoid Prolonged Exertion"
-        elif category == AQICategory.UNHEALTHY:
-            return "Avoid Prolonged Exertion" if not is_vulnerable else "Minimize Outdoor Activity"
-        elif category == AQICategory.VERY_UNHEALTHY:
-            return "Minimize Outdoor Activity" if not is_vulnerable else "Stay Indoors"
-        else:  # HAZARDOUS
-            return "Stay Indoors - Emergency"
+        return self._activity_for(self._category_index(aqi), bool(is_vulnerable))
     
     def get_mask_recommendation(self, aqi: float) -> str:
         """Get mask wearing recommendation"""
-        category = self.get_aqi_category(aqi)
-        
-        if category in [AQICategory.GOOD, AQICategory.MODERATE]:
-            return "Not necessary"
-        elif category == AQICategory.UNHEALTHY_SENSITIVE:
-            return "Recommended for sensitive groups"
-        elif category == AQICategory.UNHEALTHY:
-            return "N95 mask recommended for everyone outdoors"
-        else:  # VERY_UNHEALTHY or HAZARDOUS
-            return "N95/N99 mask required if going outdoors"
-    
-    def get_vulnerable_group_warnings(self, aqi: float) -> Dict[str, str]:
-        """Get warnings for specific vulnerable groups"""
-        category = self.get_aqi_category(aqi)
-        warnings = {}
-        
-        if category in [AQICategory.GOOD, AQICategory.MODERATE]:
-            return warnings  # No special warnings needed
-        
-        # Children
-        warnings['children'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Children should reduce prolonged outdoor play. Watch for symptoms.",
-            AQICategory.UNHEALTHY: "Children should avoid prolonged outdoor activities. Indoor play recommended.",
-            AQICategory.VERY_UNHEALTHY: "Keep children indoors. Close schools may consider closure.",
-            AQICategory.HAZARDOUS: "CRITICAL: Keep children indoors at all times. Schools should close."
-        }.get(category, "")
-        
-        # Elderly
-        warnings['elderly'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Seniors should limit time outdoors and reduce exertion.",
-            AQICategory.UNHEALTHY: "Seniors should stay indoors and minimize physical activity.",
-            AQICategory.VERY_UNHEALTHY: "Seniors must stay indoors. Monitor for chest pain or breathing difficulty.",
-            AQICategory.HAZARDOUS: "CRITICAL: Seniors should remain indoors. Seek medical help if needed."
-        }.get(category, "")
-        
-        # Pregnant women
-        warnings['pregnant_women'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Limit outdoor exposure to protect fetal health.",
-            AQICategory.UNHEALTHY: "Avoid outdoor activities. Indoor rest recommended.",
-            AQICategory.VERY_UNHEALTHY: "Stay indoors. High pollution may affect pregnancy.",
-            AQICategory.HAZARDOUS: "CRITICAL: Remain indoors. Consult doctor if experiencing symptoms."
-        }.get(category, "")
-        
-        # Asthma patients
-        warnings['asthma_patients'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Have quick-relief inhaler ready. Reduce outdoor activities.",
-            AQICategory.UNHEALTHY: "High risk of asthma attacks. Stay indoors. Keep medication close.",
-            AQICategory.VERY_UNHEALTHY: "SEVERE RISK: Stay indoors. Monitor symptoms closely. Have emergency plan ready.",
-            AQICategory.HAZARDOUS: "CRITICAL: Extreme asthma risk. Stay indoors. Seek emergency care if symptoms worsen."
-        }.get(category, "")
-        
-        # Heart disease patients
-        warnings['heart_disease_patients'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Reduce physical exertion. Monitor for chest discomfort.",
-            AQICategory.UNHEALTHY: "Avoid all outdoor activities. Rest indoors. Watch for symptoms.",
-            AQICategory.VERY_UNHEALTHY: "HIGH RISK: Stay indoors. Seek medical attention if experiencing chest pain.",
-            AQICategory.HAZARDOUS: "CRITICAL: Cardiovascular emergency risk. Stay indoors. Call doctor if symptoms appear."
-        }.get(category, "")
+        return self._mask_for(self._category_index(aqi))
+    
+    def get_vulnerable_group_warnings(self, aqi: float, group_mask: int = _ALL_GROUPS) -> Dict[str, str]:
+        """
+        Get warnings for specific vulnerable groups
         
-        # COPD patients
-        warnings['copd_patients'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Use medications as prescribed. Limit outdoor exposure.",
-            AQICategory.UNHEALTHY: "High risk of exacerbation. Stay indoors. Keep oxygen therapy ready if applicable.",
-            AQICategory.VERY_UNHEALTHY: "SEVERE RISK: Stay indoors. Monitor oxygen levels. Have emergency plan.",
-            AQICategory.HAZARDOUS: "CRITICAL: Extreme risk of respiratory failure. Stay indoors. Seek immediate care if worsening."
-        }.get(category, "")
+        Args:
+            aqi: Air Quality Index value
+            group_mask: Bitmask of groups to include (see _mask); all groups by default
+            
+        Returns:
+            Dictionary of group -> warning for the selected groups that have one
+        """
+        return self._warnings_for(self._category_index(aqi), group_mask)
+    
+    def get_vulnerable_group_warnings_array(self, aqi: np.ndarray) -> np.ndarray:
+        """
+        Get vulnerable group warnings for an array of AQI values in one lookup
         
-        # Athletes
-        warnings['athletes'] = {
-            AQICategory.UNHEALTHY_SENSITIVE: "Reduce intensity and duration of outdoor training.",
-            AQICategory.UNHEALTHY: "Move training indoors. High-intensity exercise is risky.",
-            AQICategory.VERY_UNHEALTHY: "Cancel outdoor training. Indoor low-intensity only.",
-            AQICategory.HAZARDOUS: "CRITICAL: No training. Rest and recovery mode."
-        }.get(category, "")
+        Args:
+            aqi: Array of AQI values
+            
+        Returns:
+            Object array of shape (n_groups, len(aqi)); row order follows
+            vulnerable_groups and "" marks no warning
+        """
+        return self._warn_table[:, self.categorize_batch(aqi)]
+    
+    def _mask(self, groups: List[str]) -> int:
+        """Convert a list of vulnerable group names to a bitmask (unknown names are ignored)"""
+        mask = 0
+        for group in groups or ():
+            mask |= self._GROUP_BIT.get(group, 0)
         
-        return warnings
+        return mask
+    
+    # Lookups by precomputed category index, shared by the public getters and assessments
+    def _risk_for(self, idx: int, is_vulnerable: bool) -> RiskLevel:
+        return self._RISK_TABLE[is_vulnerable][idx]
+    
+    def _message_for(self, idx: int) -> str:
+        return self._HEALTH_MESSAGES[idx]
+    
+    def _recs_for(self, idx: int, is_vulnerable: bool) -> Sequence[str]:
+        return self._REC_TABLE[is_vulnerable][idx]
+    
+    def _activity_for(self, idx: int, is_vulnerable: bool) -> str:
+        return self._ACTIVITY_TABLE[is_vulnerable][idx]
+    
+    def _mask_for(self, idx: int) -> str:
+        return self._MASK_TABLE[idx]
+    
+    def _warnings_for(self, idx: int, group_mask: int = _ALL_GROUPS) -> Dict[str, str]:
+        return {
+            group: warning
+            for group, bit, warning in zip(self._warn_groups, self._warn_bits, self._warn_table[:, idx])
+            if warning and group_mask & bit
+        }
     
     def assess_health_risk(self, 
                           aqi: float,
@@ -283,21 +425,54 @@ class HealthRiskCalculator:
         """
         is_vulnerable = bool(vulnerable_groups)
         
-        category = self.get_aqi_category(aqi)
-        risk_level = self.get_risk_level(aqi, is_vulnerable)
+        # Everything but the AQI itself depends only on (category, is_vulnerable)
+        template = self._assess_cached(self._category_index(aqi), is_vulnerable)
         
-        assessment = HealthRiskAssessment(
-            aqi=aqi,
-            aqi_category=category.value if category else "Unknown",
-            risk_level=risk_level.value if risk_level else "Unknown",
-            health_message=self.get_health_message(aqi),
-            recommendations=self.get_recommendations(aqi, is_vulnerable),
-            vulnerable_group_warnings=self.get_vulnerable_group_warnings(aqi),
-            outdoor_activity_level=self.get_outdoor_activity_level(aqi, is_vulnerable),
-            mask_recommendation=self.get_mask_recommendation(aqi)
+        return replace(template, aqi=aqi)
+    
+    def _build_assessment(self, idx: int, is_vulnerable: bool) -> HealthRiskAssessment:
+        """Build the assessment for a category index (cached per instance by _assess_cached)"""
+        return HealthRiskAssessment(
+            aqi=None,
+            aqi_category=self._CAT_LABELS[idx],
+            risk_level=self._risk_for(idx, is_vulnerable).value,
+            health_message=self._message_for(idx),
+            recommendations=self._recs_for(idx, is_vulnerable),
+            vulnerable_group_warnings=self._warnings_for(idx),
+            outdoor_activity_level=self._activity_for(idx, is_vulnerable),
+            mask_recommendation=self._mask_for(idx)
         )
+    
+    def assess_health_risk_frame(self,
+                                 aqi: pd.Series,
+                                 vulnerable_mask=False) -> pd.DataFrame:
+        """
+        Health risk assessment for a whole series of AQI values at once
         
-        return assessment
+        Args:
+            aqi: Series (or array) of Air Quality Index values
+            vulnerable_mask: Boolean or group-bitmask (see _mask) array, or a single bool; nonzero rows are vulnerable
+            
+        Returns:
+            DataFrame with one assessment per row (vulnerable group warnings excluded)
+        """
+        aqi = aqi if isinstance(aqi, pd.Series) else pd.Series(aqi)
+        values = aqi.to_numpy(dtype=np.float64, na_value=np.nan)
+        if _assess_kernel is not None and len(values) > NUMBA_MIN_ROWS:
+            idx = _assess_kernel(values, self._bp, self._UNKNOWN).astype(np.intp)
+        else:
+            idx = self.categorize_batch(values)
+        is_vul = np.broadcast_to(np.asarray(vulnerable_mask, dtype=bool), idx.shape).astype(np.intp)
+        
+        return pd.DataFrame({
+            'aqi': aqi.to_numpy(),
+            'aqi_category': self._category_labels.take(idx),
+            'risk_level': self._risk_labels[is_vul, idx],
+            'health_message': self._message_labels.take(idx),
+            'recommendations': self._rec_lists[is_vul, idx],
+            'outdoor_activity_level': self._activity_labels[is_vul, idx],
+            'mask_recommendation': self._mask_labels.take(idx)
+        }, index=aqi.index)
     
     def get_best_time_for_outdoor(self, 
                                   hourly_aqi: Dict[int, float],
@@ -316,6 +491,26 @@ class HealthRiskCalculator:
             return None, None
         
         hours = sorted(hourly_aqi.keys())
+        
+        # Contiguous hours (the common case): all window means at once. Each window
+        # is summed left to right like the loop below, so equal windows tie exactly
+        if hours[-1] - hours[0] + 1 == len(hours):
+            if len(hours) < duration_hours:
+                return None, float('inf')
+            
+            vals = np.fromiter((hourly_aqi[h] for h in hours), dtype=np.float64, count=len(hours))
+            windows = sliding_window_view(vals, duration_hours)
+            sums = windows[:, 0].copy()
+            for k in range(1, duration_hours):
+                sums += windows[:, k]
+            means = sums / duration_hours
+            
+            # Windows containing NaN (or summing to inf) never beat the loop's starting best
+            valid = means < np.inf
+            if valid.any():
+                i = int(np.argmin(np.where(valid, means, np.inf)))
+                return hours[i], float(means[i])
+        
         best_hour = None
         best_avg_aqi = float('inf')
         
@@ -325,7 +520,7 @@ class HealthRiskCalculator:
                           if start_hour <= h < start_hour + duration_hours]
             
             if len(window_hours) == duration_hours:
-                avg_aqi = np.mean([hourly_aqi[h] for h in window_hours])
+                avg_aqi = sum(hourly_aqi[h] for h in window_hours) / duration_hours
                 
                 if avg_aqi < best_avg_aqi:
                     best_avg_aqi = avg_aqi
@@ -354,21 +549,16 @@ class HealthRiskCalculator:
                 'exposure_category': 'Minimal'
             }
         
-        exposure_values = [hourly_aqi.get(h, 0) for h in outdoor_hours]
+        exposure_values = np.fromiter(
+            (hourly_aqi.get(h, 0) for h in outdoor_hours), dtype=np.float64, count=len(outdoor_hours)
+        )
         
-        total_exposure = sum(exposure_values)
-        avg_exposure = np.mean(exposure_values)
-        peak_exposure = max(exposure_values)
+        total_exposure = float(exposure_values.sum())
+        avg_exposure = total_exposure / exposure_values.size
+        peak_exposure = float(exposure_values.max())
         
         # Categorize exposure
-        if avg_exposure <= 50:
-            category = 'Low'
-        elif avg_exposure <= 100:
-            category = 'Moderate'
-        elif avg_exposure <= 150:
-            category = 'High'
-        else:
-            category = 'Very High'
+        category = EXPOSURE_CATEGORIES[int(np.searchsorted(EXPOSURE_BREAKPOINTS, avg_exposure, side='left'))]
         
         return {
             'total_exposure': round(total_exposure, 2),
@@ -379,34 +569,50 @@ class HealthRiskCalculator:
         }
 
 
+_RULE = "=" * 60
+
+_REPORT_TEMPLATE = (
+    _RULE + "\n"
+    "HEALTH RISK ASSESSMENT REPORT\n"
+    + _RULE + "\n"
+    "\nAir Quality Index: {aqi:.0f}\n"
+    "Category: {aqi_category}\n"
+    "Risk Level: {risk_level}\n"
+    "\nHealth Message:\n"
+    "{health_message}\n"
+    "\nOutdoor Activity Level: {outdoor_activity_level}\n"
+    "Mask Recommendation: {mask_recommendation}\n"
+    "\nRecommendations:"
+    "{recommendations}"
+    "{warnings}\n"
+    "\n" + _RULE
+)
+
+
 def format_assessment_report(assessment: HealthRiskAssessment) -> str:
     """Format assessment as readable report"""
-    report = []
-    report.append("=" * 60)
-    report.append("HEALTH RISK ASSESSMENT REPORT")
-    report.append("=" * 60)
-    report.append(f"\nAir Quality Index: {assessment.aqi:.0f}")
-    report.append(f"Category: {assessment.aqi_category}")
-    report.append(f"Risk Level: {assessment.risk_level}")
-    report.append(f"\nHealth Message:")
-    report.append(f"{assessment.health_message}")
-    report.append(f"\nOutdoor Activity Level: {assessment.outdoor_activity_level}")
-    report.append(f"Mask Recommendation: {assessment.mask_recommendation}")
-    
-    report.append(f"\nRecommendations:")
-    for i, rec in enumerate(assessment.recommendations, 1):
-        report.append(f"  {i}. {rec}")
+    recommendations = "".join(
+        f"\n  {i}. {rec}" for i, rec in enumerate(assessment.recommendations, 1)
+    )
     
+    warnings = ""
     if assessment.vulnerable_group_warnings:
-        report.append(f"\nVulnerable Group Warnings:")
-        for group, warning in assessment.vulnerable_group_warnings.items():
-            if warning:
-                report.append(f"\n  {group.replace('_', ' ').title()}:")
-                report.append(f"  {warning}")
-    
-    report.append("\n" + "=" * 60)
+        warnings = "\n\nVulnerable Group Warnings:" + "".join(
+            f"\n\n  {group.replace('_', ' ').title()}:\n  {warning}"
+            for group, warning in assessment.vulnerable_group_warnings.items()
+            if warning
+        )
     
-    return "\n".join(report)
+    return _REPORT_TEMPLATE.format(
+        aqi=assessment.aqi,
+        aqi_category=assessment.aqi_category,
+        risk_level=assessment.risk_level,
+        health_message=assessment.health_message,
+        outdoor_activity_level=assessment.outdoor_activity_level,
+        mask_recommendation=assessment.mask_recommendation,
+        recommendations=recommendations,
+        warnings=warnings
+    )
 
 
 # Example usage
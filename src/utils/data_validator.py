@@ -62,13 +62,16 @@ class DataValidator:
         if dtype_issues:
             results['warnings'].extend(dtype_issues)
         
+        # Checks 3, 4 and 7 share one projection of the range-checked columns
+        column_stats = self._column_stats(df)
+        
         # Check 3: Value ranges
-        range_issues = self.check_value_ranges(df)
+        range_issues = self.check_value_ranges(df, column_stats)
         if range_issues:
             results['warnings'].extend(range_issues)
         
         # Check 4: Missing data
-        missing_stats = self.check_missing_data(df)
+        missing_stats = self.check_missing_data(df, column_stats)
         results['statistics']['missing_data'] = missing_stats
         
         # Check 5: Duplicates
@@ -83,7 +86,7 @@ class DataValidator:
             results['warnings'].extend(temporal_issues)
         
         # Check 7: Statistical outliers
-        outlier_stats = self.detect_outliers(df)
+        outlier_stats = self.detect_outliers(df, column_stats)
         results['statistics']['outliers'] = outlier_stats
         
         # Summary
@@ -118,32 +121,108 @@ class DataValidator:
         
         return issues
     
-    def check_value_ranges(self, df: pd.DataFrame) -> List[str]:
+    def _range_block(self, df: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
+        """
+        Materialize the range-checked columns once as a float64 block
+        
+        Args:
+            df: DataFrame to project
+            
+        Returns:
+            Tuple of (checked columns, array of shape (len(df), len(columns)) with NaN for missing)
+        """
+        cols = [col for col in self.valid_ranges if col in df.columns]
+        
+        selected = df[cols]
+        if all(isinstance(dtype, np.dtype) for dtype in selected.dtypes):
+            block = selected.to_numpy(dtype=np.float64)
+        else:
+            # Nullable extension columns need pd.NA mapped to NaN (an extra pass over the block)
+            block = selected.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        return cols, block
+    
+    def _range_violations(self, df: pd.DataFrame, cols: List[str] = None,
+                          block: np.ndarray = None) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compare every range-checked column against its bounds in one pass
+        
+        Args:
+            df: DataFrame to check
+            cols: Checked columns, when block was already materialized by _range_block
+            block: Values of cols from _range_block
+            
+        Returns:
+            Tuple of (checked columns, below-minimum mask, above-maximum mask, missing mask);
+            masks have shape (len(df), len(columns)) and the range masks are False for NaN
+        """
+        if block is None:
+            cols, block = self._range_block(df)
+        lo = np.array([self.valid_ranges[col][0] for col in cols], dtype=np.float64)
+        hi = np.array([self.valid_ranges[col][1] for col in cols], dtype=np.float64)
+        
+        return cols, block < lo, block > hi, np.isnan(block)
+    
+    def _column_stats(self, df: pd.DataFrame) -> Dict:
+        """
+        Per-column counts for the range-checked columns, shared by the range, missing-data
+        and outlier checks
+        
+        Args:
+            df: DataFrame to check
+            
+        Returns:
+            Dictionary with 'columns', the float64 'values' block and per-column 'below',
+            'above' and 'missing' count arrays
+        """
+        cols, block = self._range_block(df)
+        _, below, above, missing = self._range_violations(df, cols, block)
+        
+        return {
+            'columns': cols,
+            'values': block,
+            'below': below.sum(axis=0),
+            'above': above.sum(axis=0),
+            'missing': missing.sum(axis=0)
+        }
+    
+    def check_value_ranges(self, df: pd.DataFrame, column_stats: Dict = None) -> List[str]:
         """Check if values are within valid ranges"""
         issues = []
         
-        for col, (min_val, max_val) in self.valid_ranges.items():
-            if col in df.columns:
-                invalid_low = (df[col] < min_val).sum()
-                invalid_high = (df[col] > max_val).sum()
-                
-                if invalid_low > 0:
-                    pct = (invalid_low / len(df)) * 100
-                    issues.append(
-                        f"{col}: {invalid_low} values ({pct:.2f}%) below valid range ({min_val})"
-                    )
-                
-                if invalid_high > 0:
-                    pct = (invalid_high / len(df)) * 100
-                    issues.append(
-                        f"{col}: {invalid_high} values ({pct:.2f}%) above valid range ({max_val})"
-                    )
+        if column_stats is None:
+            column_stats = self._column_stats(df)
+        
+        for col, invalid_low, invalid_high in zip(column_stats['columns'],
+                                                  column_stats['below'],
+                                                  column_stats['above']):
+            min_val, max_val = self.valid_ranges[col]
+            
+            if invalid_low > 0:
+                pct = (invalid_low / len(df)) * 100
+                issues.append(
+                    f"{col}: {invalid_low} values ({pct:.2f}%) below valid range ({min_val})"
+                )
+            
+            if invalid_high > 0:
+                pct = (invalid_high / len(df)) * 100
+                issues.append(
+                    f"{col}: {invalid_high} values ({pct:.2f}%) above valid range ({max_val})"
+                )
         
         return issues
     
-    def check_missing_data(self, df: pd.DataFrame) -> Dict:
+    def check_missing_data(self, df: pd.DataFrame, column_stats: Dict = None) -> Dict:
         """Analyze missing data patterns"""
-        missing = df.isnull().sum()
+        if column_stats is None:
+            missing = df.isnull().sum()
+        else:
+            # Range-checked columns were already counted; only scan the rest
+            counts = dict(zip(column_stats['columns'], column_stats['missing']))
+            missing = pd.Series(
+                [counts[col] if col in counts else df[col].isnull().sum() for col in df.columns],
+                index=df.columns, dtype=np.int64
+            )
         missing_pct = (missing / len(df) * 100).round(2)
         
         missing_stats = {
@@ -171,49 +250,73 @@ class DataValidator:
         if 'timestamp' not in df.columns:
             return issues
         
+        now = pd.Timestamp.now()
+        timestamps = df['timestamp']
+        if timestamps.dtype == 'datetime64[ns]':
+            # Naive timestamps: compare int64 nanoseconds directly, with NaT dropped up front
+            # (NaT is the int64 minimum and would otherwise count as a very old date)
+            ns = timestamps.to_numpy().view(np.int64)
+            ns = ns[ns != np.iinfo(np.int64).min]
+            future_dates = int((ns > now.value).sum())
+            old_dates = int((ns < (now - pd.Timedelta(days=3650)).value).sum())
+            time_diffs = np.diff(ns)
+            if (time_diffs < 0).any():
+                time_diffs = np.diff(np.sort(ns))
+            large_gaps = int((time_diffs > pd.Timedelta(days=7).value).sum())
+        else:
+            future_dates = (timestamps > now).sum()
+            old_dates = (timestamps < now - pd.Timedelta(days=3650)).sum()
+            large_gaps = (timestamps.sort_values().diff() > pd.Timedelta(days=7)).sum()
+        
         # Check for future dates
-        future_dates = (df['timestamp'] > pd.Timestamp.now()).sum()
         if future_dates > 0:
             issues.append(f"Found {future_dates} records with future timestamps")
         
         # Check for very old dates (> 10 years)
-        old_dates = (df['timestamp'] < pd.Timestamp.now() - pd.Timedelta(days=3650)).sum()
         if old_dates > 0:
             issues.append(f"Found {old_dates} records older than 10 years")
         
         # Check for gaps in time series
-        df_sorted = df.sort_values('timestamp')
-        time_diffs = df_sorted['timestamp'].diff()
-        large_gaps = (time_diffs > pd.Timedelta(days=7)).sum()
         if large_gaps > 0:
             issues.append(f"Found {large_gaps} time gaps larger than 7 days")
         
         return issues
     
-    def detect_outliers(self, df: pd.DataFrame) -> Dict:
+    def detect_outliers(self, df: pd.DataFrame, column_stats: Dict = None) -> Dict:
         """Detect statistical outliers using IQR method"""
         outlier_stats = {}
         
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        
-        for col in numeric_cols:
-            if col in self.valid_ranges:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-                
-                if len(outliers) > 0:
-                    outlier_stats[col] = {
-                        'count': len(outliers),
-                        'percentage': round((len(outliers) / len(df)) * 100, 2),
-                        'lower_bound': round(lower_bound, 2),
-                        'upper_bound': round(upper_bound, 2)
-                    }
+        cols = [col for col in numeric_cols if col in self.valid_ranges]
+        if not cols:
+            return outlier_stats
+        
+        # Both quartiles from one selection per column, then bounds and outlier counts on one 2-D block
+        Q1, Q3 = np.array([df[col].quantile([0.25, 0.75]).to_numpy(dtype=np.float64) for col in cols]).T
+        if column_stats is None:
+            block = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            # Reuse the block the range checks materialized instead of projecting df again
+            block = column_stats['values']
+            if cols != column_stats['columns']:
+                positions = {col: i for i, col in enumerate(column_stats['columns'])}
+                block = block[:, [positions[col] for col in cols]]
+        IQR = Q3 - Q1
+        
+        lower_bounds = Q1 - 1.5 * IQR
+        upper_bounds = Q3 + 1.5 * IQR
+        
+        counts = ((block < lower_bounds) | (block > upper_bounds)).sum(axis=0)
+        
+        for col, count, lower_bound, upper_bound in zip(cols, counts, lower_bounds, upper_bounds):
+            count = int(count)
+            if count > 0:
+                outlier_stats[col] = {
+                    'count': count,
+                    'percentage': round((count / len(df)) * 100, 2),
+                    'lower_bound': round(lower_bound, 2),
+                    'upper_bound': round(upper_bound, 2)
+                }
         
         return outlier_stats
     
@@ -240,24 +343,34 @@ class DataValidator:
         logger.info(f"Removed {initial_len - len(df_clean)} duplicate records")
         
         # Remove values outside valid ranges
-        for col, (min_val, max_val) in self.valid_ranges.items():
-            if col in df_clean.columns:
-                before = df_clean[col].notna().sum()
-                df_clean.loc[(df_clean[col] < min_val) | (df_clean[col] > max_val), col] = np.nan
-                after = df_clean[col].notna().sum()
-                if before != after:
-                    logger.info(f"Set {before - after} out-of-range values to NaN in {col}")
+        cols, below, above, _ = self._range_violations(df_clean)
+        invalid = below | above
+        
+        for col, col_invalid, count in zip(cols, invalid.T, invalid.sum(axis=0)):
+            if count:
+                df_clean[col] = df_clean[col].mask(col_invalid)
+                logger.info(f"Set {count} out-of-range values to NaN in {col}")
+            elif pd.api.types.is_integer_dtype(df_clean[col]):
+                # Range-checked columns always come out as float, whether or not anything was cleared
+                df_clean[col] = df_clean[col].astype(np.float64)
+        
+        # Metrics are low-precision by nature; store them as float32 to halve memory downstream
+        float_cols = df_clean.select_dtypes('float64').columns.intersection(list(self.valid_ranges))
+        df_clean[float_cols] = df_clean[float_cols].astype(np.float32)
         
         # Remove records with future timestamps
         if 'timestamp' in df_clean.columns:
-            future_mask = df_clean['timestamp'] > pd.Timestamp.now()
-            if future_mask.sum() > 0:
+            future_mask = (df_clean['timestamp'] > pd.Timestamp.now()).to_numpy()
+            future_count = int(future_mask.sum())
+            if future_count > 0:
                 df_clean = df_clean[~future_mask]
-                logger.info(f"Removed {future_mask.sum()} records with future timestamps")
+                logger.info(f"Removed {future_count} records with future timestamps")
         
-        # Sort by timestamp
+        # Sort by timestamp (an O(n) order check spares the sort when the data is already in order)
         if 'timestamp' in df_clean.columns:
-            df_clean = df_clean.sort_values('timestamp').reset_index(drop=True)
+            if not df_clean['timestamp'].is_monotonic_increasing:
+                df_clean = df_clean.sort_values('timestamp')
+            df_clean = df_clean.reset_index(drop=True)
         
         logger.info(f"Cleaning complete. Final records: {len(df_clean)}")
         
@@ -345,13 +458,19 @@ def validate_and_clean(input_path: str, output_path: str = None) -> pd.DataFrame
     Returns:
         Cleaned DataFrame
     """
-    # Load data
-    df = pd.read_csv(input_path)
+    # Load data (pyarrow's multithreaded parser when available; it also types ISO timestamps)
+    try:
+        df = pd.read_csv(input_path, engine='pyarrow')
+    except ImportError:
+        df = pd.read_csv(input_path)
     logger.info(f"Loaded {len(df):,} records from {input_path}")
     
-    # Convert timestamp
-    if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+    # Convert timestamp (unless the parser already did)
+    if 'timestamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+        try:
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
+        except ValueError:  # Not uniformly ISO 8601: infer the format and coerce bad values
+            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
     
     # Validate
     validator = DataValidator()
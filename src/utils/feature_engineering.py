@@ -6,10 +6,186 @@ import pandas as pd
 import numpy as np
 from typing import List, Dict
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional JIT kernel for grouped rolling statistics
+    njit = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Air-quality and weather metrics (the columns DataValidator.valid_ranges bounds); only these are stored as float32
+_METRIC_COLUMNS = ['aqi', 'pm25', 'pm10', 'no2', 'so2', 'o3', 'co',
+                   'temperature', 'humidity', 'pressure', 'wind_speed']
+
+# Row order of the stats returned by _grouped_rolling_kernel
+_KERNEL_STATS = {'mean': 0, 'std': 1, 'min': 2, 'max': 3}
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _grouped_rolling_kernel(values, order, bounds, window):
+        """
+        Trailing-window mean, std (ddof=1), min and max per group, NaN-skipping with min_periods=1
+        
+        Rows of group g are values[order[bounds[g]:bounds[g + 1]]] in time order. The mean
+        uses a compensated running sum and the variance Welford add/remove updates (as
+        pandas does); min and max use monotonic deques, so each group is a single O(rows)
+        pass whatever the window.
+        """
+        out = np.full((4, values.shape[0]), np.nan)
+        
+        for g in prange(bounds.shape[0] - 1):
+            start = bounds[g]
+            m = bounds[g + 1] - start
+            min_q = np.empty(m, np.int64)
+            max_q = np.empty(m, np.int64)
+            min_head = min_tail = max_head = max_tail = 0
+            nobs = 0
+            total = 0.0
+            comp = 0.0  # Kahan compensation for the running sum behind the mean
+            mean = 0.0
+            ssqdm = 0.0
+            last = np.nan
+            repeats = 0  # trailing run of identical values; a window inside it is exactly constant
+            
+            for i in range(m):
+                # Drop the value leaving the window
+                j = i - window
+                if j >= 0:
+                    y = values[order[start + j]]
+                    if y == y:
+                        nobs -= 1
+                        t = total + (-y - comp)
+                        comp = t - total - (-y - comp)
+                        total = t
+                        if nobs == 0:
+                            total = 0.0
+                            comp = 0.0
+                            mean = 0.0
+                            ssqdm = 0.0
+                        else:
+                            delta = y - mean
+                            mean -= delta / nobs
+                            ssqdm -= delta * (y - mean)
+                while min_tail > min_head and min_q[min_head] <= j:
+                    min_head += 1
+                while max_tail > max_head and max_q[max_head] <= j:
+                    max_head += 1
+                
+                # Add the value entering the window
+                x = values[order[start + i]]
+                if x == x:
+                    nobs += 1
+                    t = total + (x - comp)
+                    comp = t - total - (x - comp)
+                    total = t
+                    delta = x - mean
+                    mean += delta / nobs
+                    ssqdm += delta * (x - mean)
+                    repeats = repeats + 1 if x == last else 1
+                    last = x
+                    while min_tail > min_head and values[order[start + min_q[min_tail - 1]]] >= x:
+                        min_tail -= 1
+                    min_q[min_tail] = i
+                    min_tail += 1
+                    while max_tail > max_head and values[order[start + max_q[max_tail - 1]]] <= x:
+                        max_tail -= 1
+                    max_q[max_tail] = i
+                    max_tail += 1
+                
+                row = order[start + i]
+                constant = repeats >= nobs
+                if nobs >= 1:
+                    out[0, row] = last if constant else total / nobs
+                    out[2, row] = values[order[start + min_q[min_head]]]
+                    out[3, row] = values[order[start + max_q[max_head]]]
+                if nobs >= 2:
+                    out[1, row] = 0.0 if constant else np.sqrt(max(ssqdm / (nobs - 1), 0.0))
+        
+        return out
+else:
+    _grouped_rolling_kernel = None
+
+# Cyclical encodings for every possible hour, weekday, month and day of year.
+# Tables are indexed by the component itself; the NaN slot (24, 7 or 0) stands in for a missing timestamp
+_HOUR_ANGLES = 2 * np.pi * np.append(np.arange(24), np.nan) / 24
+_DOW_ANGLES = 2 * np.pi * np.append(np.arange(7), np.nan) / 7
+_MONTH_ANGLES = 2 * np.pi * (np.append(np.nan, np.arange(1, 13)) - 1) / 12
+_DOY_ANGLES = 2 * np.pi * (np.append(np.nan, np.arange(1, 367)) - 1) / 365
+_CYCLICAL_LUT = {
+    'hour': ('hour', 24, np.sin(_HOUR_ANGLES), np.cos(_HOUR_ANGLES)),
+    'dow': ('day_of_week', 7, np.sin(_DOW_ANGLES), np.cos(_DOW_ANGLES)),
+    'month': ('month', 0, np.sin(_MONTH_ANGLES), np.cos(_MONTH_ANGLES)),
+    'day_of_year': ('day_of_year', 0, np.sin(_DOY_ANGLES), np.cos(_DOY_ANGLES))
+}
+
+# Season by month (Northern Hemisphere); index 0 stands in for a missing month
+_SEASON_LUT = np.array([4, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 1], dtype=np.int64)
+
+# Hour-of-day flags; index 24 stands in for a missing hour
+_RUSH_HOUR_LUT = np.zeros(25, dtype=np.int64)
+_RUSH_HOUR_LUT[[7, 8, 9, 17, 18, 19, 20]] = 1
+_NIGHT_LUT = np.zeros(25, dtype=np.int64)
+_NIGHT_LUT[0:6] = 1
+_PEAK_POLLUTION_LUT = np.zeros(25, dtype=np.int64)
+_PEAK_POLLUTION_LUT[[19, 20, 21]] = 1
+
+
+def _is_sorted(df: pd.DataFrame, keys: List[str]) -> bool:
+    """
+    Check in one O(n) pass whether df rows are already in ascending order of keys
+    
+    Args:
+        df: DataFrame to check
+        keys: Sort keys, most significant first
+        
+    Returns:
+        True when sort_values(keys) would leave the rows in place; False when unsure
+        (missing values or keys that do not compare)
+    """
+    if len(df) < 2:
+        return True
+    
+    tied = np.ones(len(df) - 1, dtype=bool)  # rows equal on every key checked so far
+    for key in keys:
+        column = df[key]
+        if column.hasnans:
+            return False
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            values = column.cat.codes.to_numpy()
+        else:
+            values = column.to_numpy()
+        try:
+            if (tied & (values[1:] < values[:-1])).any():
+                return False
+            tied &= values[1:] == values[:-1]
+        except TypeError:
+            return False
+    
+    return True
+
+
+def _with_columns(df: pd.DataFrame, new_cols: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Return a copy of df with new_cols added in a single concat
+    
+    Args:
+        df: Input DataFrame (left unmodified)
+        new_cols: Column name -> values aligned by position with df
+        
+    Returns:
+        New DataFrame; names that already exist in df are replaced in place
+    """
+    added = {name: values for name, values in new_cols.items() if name not in df.columns}
+    df = pd.concat([df, pd.DataFrame(added, index=df.index)], axis=1)
+    
+    for name in new_cols.keys() - added.keys():
+        df[name] = new_cols[name]
+    
+    return df
+
 
 class AirQualityFeatureEngineer:
     """Feature engineering for air quality data"""
@@ -35,22 +211,31 @@ class AirQualityFeatureEngineer:
         Returns:
             DataFrame with lag features added
         """
+        return _with_columns(df, self._lag_columns(df, features, lag_hours, group_col))
+    
+    def _lag_columns(self, df: pd.DataFrame, features: List[str],
+                     lag_hours: List[int] = None, group_col: str = 'city_name') -> Dict[str, np.ndarray]:
+        """New lag columns for create_lag_features; df is left unmodified"""
         if lag_hours is None:
             lag_hours = self.lag_hours
         
-        df = df.copy()
+        new_cols = {}
+        
+        # Group once; each feature's shifts reuse the same grouping
+        grouped = df.groupby(group_col, sort=False, observed=True)
         
         for feature in features:
             if feature not in df.columns:
                 logger.warning(f"Feature {feature} not found in DataFrame")
                 continue
-                
+            
+            feature_groups = grouped[feature]
             for lag in lag_hours:
                 col_name = f'{feature}_lag_{lag}h'
-                df[col_name] = df.groupby(group_col)[feature].shift(lag)
+                new_cols[col_name] = feature_groups.shift(lag).to_numpy()
         
         logger.info(f"Created {len(features) * len(lag_hours)} lag features")
-        return df
+        return new_cols
     
     def create_rolling_features(self, df: pd.DataFrame,
                                features: List[str],
@@ -70,41 +255,55 @@ class AirQualityFeatureEngineer:
         Returns:
             DataFrame with rolling features added
         """
+        return _with_columns(df, self._rolling_columns(df, features, windows, stats, group_col))
+    
+    def _rolling_columns(self, df: pd.DataFrame, features: List[str],
+                         windows: List[int] = None, stats: List[str] = None,
+                         group_col: str = 'city_name') -> Dict[str, np.ndarray]:
+        """New rolling-statistic columns for create_rolling_features; df is left unmodified"""
         if windows is None:
             windows = self.rolling_windows
         
         if stats is None:
             stats = ['mean', 'std', 'min', 'max']
         
-        df = df.copy()
+        stats = [stat for stat in stats if stat in ('mean', 'std', 'min', 'max')]
+        
+        new_cols = {}
+        
+        # Split rows by group once; every feature, window and stat reuses the same split
+        group_positions = list(df.groupby(group_col, sort=False, observed=True).indices.values())
+        if _grouped_rolling_kernel is not None and group_positions:
+            order = np.concatenate(group_positions)
+            bounds = np.cumsum([0] + [len(positions) for positions in group_positions])
         
         for feature in features:
             if feature not in df.columns:
                 continue
-                
+            
+            values = df[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+            
             for window in windows:
-                for stat in stats:
-                    col_name = f'{feature}_rolling_{window}h_{stat}'
-                    
-                    if stat == 'mean':
-                        df[col_name] = df.groupby(group_col)[feature].transform(
-                            lambda x: x.rolling(window=window, min_periods=1).mean()
-                        )
-                    elif stat == 'std':
-                        df[col_name] = df.groupby(group_col)[feature].transform(
-                            lambda x: x.rolling(window=window, min_periods=1).std()
-                        )
-                    elif stat == 'min':
-                        df[col_name] = df.groupby(group_col)[feature].transform(
-                            lambda x: x.rolling(window=window, min_periods=1).min()
-                        )
-                    elif stat == 'max':
-                        df[col_name] = df.groupby(group_col)[feature].transform(
-                            lambda x: x.rolling(window=window, min_periods=1).max()
-                        )
+                if _grouped_rolling_kernel is not None and group_positions:
+                    # All four stats for every group in one compiled pass
+                    kernel_out = _grouped_rolling_kernel(values, order, bounds, window)
+                    for stat in stats:
+                        new_cols[f'{feature}_rolling_{window}h_{stat}'] = kernel_out[_KERNEL_STATS[stat]]
+                    continue
+                
+                results = np.full((len(stats), len(df)), np.nan)
+                
+                for positions in group_positions:
+                    # One rolling window per group serves all requested stats
+                    rolling = pd.Series(values[positions]).rolling(window=window, min_periods=1)
+                    for i, stat in enumerate(stats):
+                        results[i, positions] = getattr(rolling, stat)().to_numpy()
+                
+                for stat, result in zip(stats, results):
+                    new_cols[f'{feature}_rolling_{window}h_{stat}'] = result
         
         logger.info(f"Created rolling statistics features")
-        return df
+        return new_cols
     
     def create_change_features(self, df: pd.DataFrame,
                               features: List[str],
@@ -122,26 +321,34 @@ class AirQualityFeatureEngineer:
         Returns:
             DataFrame with change features added
         """
+        return _with_columns(df, self._change_columns(df, features, periods, group_col))
+    
+    def _change_columns(self, df: pd.DataFrame, features: List[str],
+                        periods: List[int] = None, group_col: str = 'city_name') -> Dict[str, np.ndarray]:
+        """New change columns for create_change_features; df is left unmodified"""
         if periods is None:
             periods = self.change_periods
         
-        df = df.copy()
+        new_cols = {}
+        
+        grouped = df.groupby(group_col, sort=False, observed=True)
         
         for feature in features:
             if feature not in df.columns:
                 continue
-                
+            
+            feature_groups = grouped[feature]
             for period in periods:
                 # Absolute change
                 col_name = f'{feature}_change_{period}h'
-                df[col_name] = df.groupby(group_col)[feature].diff(period)
+                new_cols[col_name] = feature_groups.diff(period).to_numpy()
                 
                 # Percentage change
                 col_name_pct = f'{feature}_pct_change_{period}h'
-                df[col_name_pct] = df.groupby(group_col)[feature].pct_change(period) * 100
+                new_cols[col_name_pct] = feature_groups.pct_change(period).to_numpy() * 100
         
         logger.info(f"Created rate of change features")
-        return df
+        return new_cols
     
     def create_temporal_features(self, df: pd.DataFrame,
                                 timestamp_col: str = 'timestamp') -> pd.DataFrame:
@@ -155,47 +362,61 @@ class AirQualityFeatureEngineer:
         Returns:
             DataFrame with temporal features added
         """
-        df = df.copy()
+        return _with_columns(df, self._temporal_columns(df, timestamp_col))
+    
+    def _temporal_columns(self, df: pd.DataFrame, timestamp_col: str = 'timestamp') -> Dict[str, np.ndarray]:
+        """New temporal columns for create_temporal_features; df is left unmodified"""
+        new_cols = {}
         
         # Ensure timestamp is datetime
-        df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+        timestamps = df[timestamp_col]
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps)
+            new_cols[timestamp_col] = timestamps
         
         # Extract components
-        df['hour'] = df[timestamp_col].dt.hour
-        df['day_of_week'] = df[timestamp_col].dt.dayofweek
-        df['month'] = df[timestamp_col].dt.month
-        df['day_of_year'] = df[timestamp_col].dt.dayofyear
-        df['week_of_year'] = df[timestamp_col].dt.isocalendar().week
-        
-        # Cyclical encoding
-        df['hour_sin'] = np.sin(2 * np.pi * df['hour'] / 24)
-        df['hour_cos'] = np.cos(2 * np.pi * df['hour'] / 24)
-        
-        df['dow_sin'] = np.sin(2 * np.pi * df['day_of_week'] / 7)
-        df['dow_cos'] = np.cos(2 * np.pi * df['day_of_week'] / 7)
-        
-        df['month_sin'] = np.sin(2 * np.pi * (df['month'] - 1) / 12)
-        df['month_cos'] = np.cos(2 * np.pi * (df['month'] - 1) / 12)
-        
-        df['day_of_year_sin'] = np.sin(2 * np.pi * (df['day_of_year'] - 1) / 365)
-        df['day_of_year_cos'] = np.cos(2 * np.pi * (df['day_of_year'] - 1) / 365)
+        if timestamps.dtype == 'datetime64[ns]' and not timestamps.isna().any():
+            # Naive, complete timestamps: derive every component from one datetime64 array
+            values = timestamps.to_numpy()
+            days = values.astype('datetime64[D]')
+            months = values.astype('datetime64[M]')
+            years = values.astype('datetime64[Y]')
+            new_cols['hour'] = ((values - days) // np.timedelta64(1, 'h')).astype(np.int32)
+            new_cols['day_of_week'] = ((days.view(np.int64) + 3) % 7).astype(np.int32)  # 1970-01-01 was a Thursday
+            new_cols['month'] = (months.view(np.int64) % 12 + 1).astype(np.int32)
+            new_cols['day_of_year'] = ((days - years.astype('datetime64[D]')).view(np.int64) + 1).astype(np.int32)
+        else:
+            new_cols['hour'] = timestamps.dt.hour.to_numpy()
+            new_cols['day_of_week'] = timestamps.dt.dayofweek.to_numpy()
+            new_cols['month'] = timestamps.dt.month.to_numpy()
+            new_cols['day_of_year'] = timestamps.dt.dayofyear.to_numpy()
+        new_cols['week_of_year'] = timestamps.dt.isocalendar().week.array
+        
+        def positions(col, missing):
+            # Table index per row; NaN components (from NaT) map to the table's missing slot
+            values = new_cols[col]
+            if values.dtype.kind == 'f':
+                values = np.where(np.isnan(values), missing, values)
+            return values.astype(np.intp)
+        
+        # Cyclical encoding, gathered from precomputed tables
+        for prefix, (col, missing, sin_lut, cos_lut) in _CYCLICAL_LUT.items():
+            index = positions(col, missing)
+            new_cols[f'{prefix}_sin'] = sin_lut[index]
+            new_cols[f'{prefix}_cos'] = cos_lut[index]
         
         # Categorical temporal features
-        df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
-        df['is_rush_hour'] = df['hour'].isin([7, 8, 9, 17, 18, 19, 20]).astype(int)
-        df['is_night'] = df['hour'].isin(range(0, 6)).astype(int)
-        df['is_peak_pollution'] = df['hour'].isin([19, 20, 21]).astype(int)
-        
-        # Season (Northern Hemisphere)
-        df['season'] = df['month'].apply(lambda x: 
-            1 if x in [12, 1, 2] else  # Winter
-            2 if x in [3, 4, 5] else    # Spring
-            3 if x in [6, 7, 8] else    # Summer
-            4                            # Fall
-        )
+        hour = positions('hour', 24)
+        new_cols['is_weekend'] = (new_cols['day_of_week'] >= 5).astype(int)
+        new_cols['is_rush_hour'] = _RUSH_HOUR_LUT[hour]
+        new_cols['is_night'] = _NIGHT_LUT[hour]
+        new_cols['is_peak_pollution'] = _PEAK_POLLUTION_LUT[hour]
+        
+        # Season (Northern Hemisphere): 1 Winter, 2 Spring, 3 Summer, 4 Fall
+        new_cols['season'] = _SEASON_LUT[positions('month', 0)]
         
         logger.info("Created temporal features")
-        return df
+        return new_cols
     
     def create_weather_interactions(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -207,7 +428,11 @@ class AirQualityFeatureEngineer:
         Returns:
             DataFrame with interaction features added
         """
-        df = df.copy()
+        return _with_columns(df, self._weather_columns(df))
+    
+    def _weather_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """New interaction columns for create_weather_interactions; df is left unmodified"""
+        new_cols = {}
         
         weather_features = {
             'temperature': 'temperature',
@@ -216,27 +441,27 @@ class AirQualityFeatureEngineer:
             'wind_speed': 'wind_speed'
         }
         
-        # Check which features exist
-        available = {k: v for k, v in weather_features.items() if v in df.columns}
+        # Check which features exist, and read each one once as a raw array (no index alignment)
+        available = {k: df[v].to_numpy() for k, v in weather_features.items() if v in df.columns}
         
         if 'temperature' in available and 'humidity' in available:
-            df['temp_humidity_interaction'] = df['temperature'] * df['humidity']
-            df['comfort_index'] = df['temperature'] + (0.4 * df['humidity'])
+            new_cols['temp_humidity_interaction'] = available['temperature'] * available['humidity']
+            new_cols['comfort_index'] = available['temperature'] + (0.4 * available['humidity'])
         
         if 'temperature' in available:
-            df['temperature_squared'] = df['temperature'] ** 2
+            new_cols['temperature_squared'] = available['temperature'] ** 2
         
         if 'humidity' in available:
-            df['humidity_squared'] = df['humidity'] ** 2
+            new_cols['humidity_squared'] = available['humidity'] ** 2
         
         if 'temperature' in available and 'wind_speed' in available:
-            df['wind_chill'] = df['temperature'] - (df['wind_speed'] * 0.5)
+            new_cols['wind_chill'] = available['temperature'] - (available['wind_speed'] * 0.5)
         
         if 'pressure' in available:
-            df['pressure_change_3h'] = df.groupby('city_name')['pressure'].diff(3)
+            new_cols['pressure_change_3h'] = df.groupby('city_name', observed=True)['pressure'].diff(3).to_numpy()
         
         logger.info("Created weather interaction features")
-        return df
+        return new_cols
     
     def create_pollutant_ratios(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -248,20 +473,24 @@ class AirQualityFeatureEngineer:
         Returns:
             DataFrame with ratio features added
         """
-        df = df.copy()
+        return _with_columns(df, self._ratio_columns(df))
+    
+    def _ratio_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """New ratio columns for create_pollutant_ratios; df is left unmodified"""
+        new_cols = {}
         
         if 'pm25' in df.columns and 'pm10' in df.columns:
-            df['pm25_pm10_ratio'] = df['pm25'] / (df['pm10'] + 1e-6)
-            df['total_pm'] = df['pm25'] + df['pm10']
+            new_cols['pm25_pm10_ratio'] = (df['pm25'] / (df['pm10'] + 1e-6)).to_numpy()
+            new_cols['total_pm'] = (df['pm25'] + df['pm10']).to_numpy()
         
         if 'no2' in df.columns and 'o3' in df.columns:
-            df['no2_o3_ratio'] = df['no2'] / (df['o3'] + 1e-6)
+            new_cols['no2_o3_ratio'] = (df['no2'] / (df['o3'] + 1e-6)).to_numpy()
         
         if 'so2' in df.columns and 'no2' in df.columns:
-            df['so2_no2_ratio'] = df['so2'] / (df['no2'] + 1e-6)
+            new_cols['so2_no2_ratio'] = (df['so2'] / (df['no2'] + 1e-6)).to_numpy()
         
         logger.info("Created pollutant ratio features")
-        return df
+        return new_cols
     
     def engineer_all_features(self, df: pd.DataFrame,
                              lag_features: List[str] = None,
@@ -291,16 +520,47 @@ class AirQualityFeatureEngineer:
         if change_features is None:
             change_features = ['aqi', 'pm25', 'temperature', 'pressure']
         
-        # Sort data
-        df = df.sort_values(['city_name', 'timestamp']).reset_index(drop=True)
-        
-        # Create features
-        df = self.create_temporal_features(df)
-        df = self.create_lag_features(df, lag_features)
-        df = self.create_rolling_features(df, rolling_features)
-        df = self.create_change_features(df, change_features)
-        df = self.create_weather_interactions(df)
-        df = self.create_pollutant_ratios(df)
+        # Sort data (loaders usually hand over rows already in this order)
+        if not _is_sorted(df, ['city_name', 'timestamp']):
+            df = df.sort_values(['city_name', 'timestamp'])
+        df = df.reset_index(drop=True)
+        
+        # Every step groups by city; categorical codes spare re-hashing the names each time
+        if df['city_name'].dtype == object:
+            df['city_name'] = df['city_name'].astype('category')
+        
+        # Metrics are low-precision by nature; float32 halves the bytes each lag/rolling/change pass moves
+        float_cols = df.select_dtypes('float64').columns.intersection(_METRIC_COLUMNS)
+        df[float_cols] = df[float_cols].astype(np.float32)
+        
+        # Every stage reads only the input columns, so each builds just its new columns from
+        # the same frame and a single concat adds them all. Lag, change, weather and ratio
+        # builders run side by side; rolling stays on this thread because numba's parallel
+        # runtime must not be launched from a worker. Merging in stage order keeps the column
+        # layout of applying the create_* methods one after another
+        stages = [
+            (self._lag_columns, (lag_features,)),
+            (self._change_columns, (change_features,)),
+            (self._weather_columns, ()),
+            (self._ratio_columns, ()),
+        ]
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(stage, df, *args) for stage, args in stages]
+            temporal = self._temporal_columns(df)
+            rolling = self._rolling_columns(df, rolling_features)
+            results = [future.result() for future in futures]
+        results[1:1] = [rolling]
+        
+        new_cols = dict(temporal)
+        for result in results:
+            new_cols.update(result)
+        
+        # Rolling statistics and cyclical encodings come back as float64; keep the whole frame float32
+        for name, values in new_cols.items():
+            if values.dtype == np.float64:
+                new_cols[name] = values.astype(np.float32)
+        
+        df = _with_columns(df, new_cols)
         
         logger.info(f"Feature engineering complete. Total columns: {len(df.columns)}")
         
@@ -319,9 +579,16 @@ def load_and_engineer_features(data_path: str,
     Returns:
         DataFrame with engineered features
     """
-    # Load data
-    df = pd.read_csv(data_path)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    # Load data (pyarrow's multithreaded parser when available; it also types ISO timestamps)
+    try:
+        df = pd.read_csv(data_path, engine='pyarrow')
+    except ImportError:
+        df = pd.read_csv(data_path)
+    if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+        try:
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
+        except ValueError:  # Not uniformly ISO 8601: let pandas infer the format
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
     
     logger.info(f"Loaded {len(df):,} records from {data_path}")
     
@@ -7,8 +7,11 @@ import sys
 from pathlib import Path
 import numpy as np
 import pandas as pd
-import pickle
 import json
+import orjson
+import joblib
+import functools
+from types import MappingProxyType
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,26 +20,102 @@ sys.path.append(str(project_root))
 from src.health_risk.risk_assessment import HealthRiskCalculator
 
 
-@pytest.fixture
+# Marked tests are skipped unless their option is given, keeping default runs off live APIs and SHAP artifacts
+OPT_IN_MARKERS = {
+    'network': ('--run-network', "test calls live air-quality APIs"),
+    'explainability': ('--run-explainability', "test loads SHAP explainability artifacts"),
+    'perf': ('--run-perf', "test times a hot path with pytest-benchmark")
+}
+
+
+def pytest_addoption(parser):
+    for marker, (option, _) in OPT_IN_MARKERS.items():
+        parser.addoption(option, action="store_true", default=False, help=f"run tests marked {marker}")
+    parser.addoption("--use-requests-cache", action="store_true", default=False,
+                     help="serve repeated API calls from a local requests-cache (needs requests-cache)")
+
+
+def pytest_configure(config):
+    for marker, (option, description) in OPT_IN_MARKERS.items():
+        config.addinivalue_line("markers", f"{marker}: {description} (run with {option})")
+    
+    if config.getoption("--use-requests-cache"):
+        try:
+            import requests_cache  # noqa: F401
+        except ImportError:
+            raise pytest.UsageError("--use-requests-cache needs requests-cache (pip install requests-cache)")
+
+
+def pytest_collection_modifyitems(config, items):
+    for marker, (option, _) in OPT_IN_MARKERS.items():
+        if config.getoption(option):
+            continue
+        skip = pytest.mark.skip(reason=f"{marker} test; run with {option}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+# Read-only, so every test can share the one mapping
+SAMPLE_AQI_VALUES = MappingProxyType({
+    'good': 25.0,
+    'moderate': 75.0,
+    'unhealthy_sensitive': 125.0,
+    'unhealthy': 175.0,
+    'very_unhealthy': 250.0,
+    'hazardous': 350.0
+})
+
+
+@pytest.fixture(scope="session")
 def sample_aqi_values():
     """Sample AQI values for testing different categories"""
+    return SAMPLE_AQI_VALUES
+
+
+@pytest.fixture(scope="session")
+def hourly_timestamps():
+    """Hourly timestamps from 2024-01-01; tests slice the first n instead of building their own range"""
+    return pd.date_range('2024-01-01', periods=100, freq='h')
+
+
+@pytest.fixture(scope="session")
+def synthetic_readings():
+    """Seeded uniform float32 pollutant readings (100 per column), generated once; tests slice what they need"""
+    rng = np.random.default_rng(42)
+    
+    def uniform(low, high):
+        return np.float32(low) + np.float32(high - low) * rng.random(100, dtype=np.float32)
+    
     return {
-        'good': 25.0,
-        'moderate': 75.0,
-        'unhealthy_sensitive': 125.0,
-        'unhealthy': 175.0,
-        'very_unhealthy': 250.0,
-        'hazardous': 350.0
+        'aqi': uniform(20, 150),
+        'pm25': uniform(20, 100),
+        'pm10': uniform(30, 150)
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def risk_calculator():
     """Health risk calculator instance"""
     return HealthRiskCalculator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def assess(risk_calculator):
+    """
+    Memoized risk_calculator.assess_health_risk shared by every test
+    Vulnerable groups go in as a tuple; returned assessments are shared, so tests must not modify them
+    """
+    @functools.lru_cache(maxsize=None)
+    def cached_assessment(aqi, vulnerable_groups=None):
+        return risk_calculator.assess_health_risk(
+            aqi, list(vulnerable_groups) if vulnerable_groups is not None else None
+        )
+    
+    return cached_assessment
+
+
+@pytest.fixture(scope="session")
 def sample_features():
     """Sample feature data for predictions"""
     return {
@@ -77,21 +156,120 @@ def sample_features():
 
 
 @pytest.fixture(scope="session")
-def backend_initialized():
+def explainer_data():
+    """Seeded (X, y, feature names) for explainability tests: 200 rows x 8 features"""
+    rng = np.random.default_rng(7)
+    X = rng.random((200, 8), dtype=np.float32) * np.float32(100)
+    y = X @ np.linspace(0.2, 1.6, 8) + rng.normal(0, 5, 200)
+    return X, y, [f"feature_{i}" for i in range(8)]
+
+
+@pytest.fixture(scope="session", params=["xgboost", "gradient_boosting"])
+def tree_model(request, explainer_data):
+    """Small tree regressor trained in-test (XGBoost and sklearn gradient boosting)"""
+    X, y, _ = explainer_data
+    if request.param == "xgboost":
+        xgb = pytest.importorskip("xgboost")
+        model = xgb.XGBRegressor(n_estimators=30, max_depth=3, random_state=0)
+    else:
+        from sklearn.ensemble import GradientBoostingRegressor
+        model = GradientBoostingRegressor(n_estimators=30, max_depth=3, random_state=0)
+    
+    return model.fit(X, y)
+
+
+@pytest.fixture(scope="session")
+def shap_explainer(tree_model, explainer_data):
+    """SHAPExplainer over tree_model, built once per model"""
+    pytest.importorskip("shap")
+    from src.explainability.shap_explainer import SHAPExplainer
+    
+    return SHAPExplainer(tree_model, explainer_data[2])
+
+
+@pytest.fixture(scope="session")
+def feature_sets():
+    """Parsed data/processed/feature_sets.json, read once per session (None when the file is missing)"""
+    path = Path("data/processed/feature_sets.json")
+    return json.loads(path.read_bytes()) if path.exists() else None
+
+
+MODEL_PATH = Path("data/models/best_model_gradientboosting.pkl")
+MODEL_PATHS = (
+    MODEL_PATH,
+    Path("data/models/xgboost_tuned.pkl"),
+    Path("data/models/best_model_xgboost_tuned.pkl")
+)
+
+
+@pytest.fixture(scope="session")
+def existing_model_paths():
+    """Model files present on disk, checked once per session"""
+    return tuple(path for path in MODEL_PATHS if path.exists())
+
+
+@pytest.fixture(scope="session")
+def model_path(existing_model_paths):
+    """First available model file, in MODEL_PATHS order (None when there is none)"""
+    return existing_model_paths[0] if existing_model_paths else None
+
+
+@pytest.fixture(scope="session")
+def loaded_model(existing_model_paths):
+    """Unpickled gradient boosting model, loaded once per session (None when the file is missing)
+    
+    joblib memory-maps the model's arrays when the file was written with
+    joblib.dump; plain pickles load exactly as pickle.load would.
+    """
+    if MODEL_PATH not in existing_model_paths:
+        return None
+    
+    return joblib.load(MODEL_PATH, mmap_mode='r')
+
+
+@pytest.fixture(scope="session")
+def gb_model(loaded_model):
+    """The session's gradient boosting model; tests that need it skip when it is missing"""
+    if loaded_model is None:
+        pytest.skip("Model file not found")
+    return loaded_model
+
+
+@pytest.fixture(scope="session")
+def model_input():
+    """Seeded dummy feature matrix (16 rows x 33 features) for model prediction tests
+    
+    float32 matches the dtype sklearn's tree ensembles predict on, so no
+    converted copy is made per predict call.
+    """
+    rng = np.random.default_rng(42)
+    return rng.random((16, 33), dtype=np.float32) * np.float32(100)
+
+
+@pytest.fixture(scope="session")
+def model_predictions(gb_model, model_input):
+    """Predictions for model_input from a single batched predict call"""
+    try:
+        return gb_model.predict(model_input)
+    except Exception as e:
+        pytest.skip(f"Prediction failed: {e}")
+
+
+@pytest.fixture(scope="session")
+def backend_initialized(feature_sets, loaded_model):
     """
     Initialize backend resources once for all tests
     This loads the model and data to avoid startup issues
+    Under pytest-xdist each worker process runs this once for its share of the tests
     """
     try:
         from backend.app import main as backend_main
         
         # Manually trigger resource loading
-        MODEL_PATH = Path("data/models/best_model_gradientboosting.pkl")
-        FEATURES_PATH = Path("data/processed/feature_sets.json")
         TEST_DATA_PATH = Path("data/processed/features_test.csv")
         
         # Check if files exist
-        if not MODEL_PATH.exists():
+        if loaded_model is None:
             print(f"⚠️  Model not found at {MODEL_PATH}")
             return False
         
@@ -99,9 +277,8 @@ def backend_initialized():
             print(f"⚠️  Test data not found at {TEST_DATA_PATH}")
             return False
         
-        # Load model
-        with open(MODEL_PATH, 'rb') as f:
-            backend_main.model = pickle.load(f)
+        # Load model (shared with the model tests)
+        backend_main.model = loaded_model
         
         # Fix gpu_id attribute
         if not hasattr(backend_main.model, 'gpu_id'):
@@ -114,9 +291,10 @@ def backend_initialized():
             backend_main.booster = None
         
         # Load features
-        with open(FEATURES_PATH, 'r') as f:
-            features = json.load(f)
-            backend_main.feature_list = features['comprehensive']
+        if feature_sets is None:
+            print("⚠️  Feature sets not found at data/processed/feature_sets.json")
+            return False
+        backend_main.feature_list = feature_sets['comprehensive']
         
         # Load test data
         backend_main.test_data = pd.read_csv(TEST_DATA_PATH)
@@ -159,32 +337,98 @@ def backend_initialized():
         return False
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client(backend_initialized):
     """
     FastAPI test client with properly initialized backend
+    Built and health-checked once; every endpoint test shares it
     """
     try:
+        import anyio
         from fastapi.testclient import TestClient
         from backend.app.main import app
+    except ImportError as e:
+        pytest.skip(f"FastAPI or backend not available: {e}")
+    
+    if not backend_initialized:
+        pytest.skip("Backend initialization failed - check model and data files")
+    
+    # One event-loop thread serves every request of the session; entering the
+    # client as a context manager instead would rerun the app's startup loading
+    with anyio.from_thread.start_blocking_portal() as portal:
+        try:
+            # Create test client
+            client = TestClient(app)
+            client.portal = portal
+            
+            # Verify backend is working
+            response = client.get("/health")
+        except Exception as e:
+            pytest.skip(f"Test client initialization failed: {e}")
         
-        if not backend_initialized:
-            pytest.skip("Backend initialization failed - check model and data files")
-        
-        # Create test client
-        client = TestClient(app)
-        
-        # Verify backend is working
-        response = client.get("/health")
         if response.status_code != 200:
             pytest.skip("Backend health check failed")
         
-        return client
-        
-    except ImportError as e:
-        pytest.skip(f"FastAPI or backend not available: {e}")
-    except Exception as e:
-        pytest.skip(f"Test client initialization failed: {e}")
+        yield client
+        client.portal = None
+
+
+# Side-effect-free GET endpoints; their responses are fetched together once per session
+READONLY_ENDPOINTS = ("/", "/health", "/api/cities", "/api/stats", "/api/vulnerable-groups")
+
+
+@pytest.fixture(scope="session")
+def fetch_concurrently(test_client):
+    """
+    GET several paths at once over the app's ASGI transport; returns responses in path order
+    Lets independent requests overlap instead of queueing through TestClient one by one
+    """
+    import asyncio
+    import httpx
+    from backend.app.main import app
+    
+    async def fetch_all(paths):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await asyncio.gather(*(client.get(path) for path in paths))
+    
+    def fetch(paths):
+        return asyncio.run(fetch_all(paths))
+    
+    return fetch
+
+
+@pytest.fixture(scope="session")
+def readonly_responses(fetch_concurrently):
+    """
+    Responses of READONLY_ENDPOINTS, requested concurrently once per session
+    Each endpoint test still asserts on its own response
+    """
+    return dict(zip(READONLY_ENDPOINTS, fetch_concurrently(READONLY_ENDPOINTS)))
+
+
+@pytest.fixture(scope="session")
+def cities(readonly_responses):
+    """City names from /api/cities, fetched once for every test that needs a valid city"""
+    return orjson.loads(readonly_responses["/api/cities"].content)['cities']
+
+
+@pytest.fixture(scope="session", autouse=True)
+def use_requests_cache(pytestconfig):
+    """
+    Cache live API responses on disk for 12 hours when --use-requests-cache is given
+    Repeated network test runs then skip the round trips to OpenAQ and friends
+    """
+    if not pytestconfig.getoption("--use-requests-cache"):
+        yield
+        return
+    
+    import requests_cache
+    from datetime import timedelta
+    
+    requests_cache.install_cache(cache_name=".cache/requests-cache", expire_after=timedelta(hours=12))
+    yield
+    requests_cache.uninstall_cache()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -0,0 +1,27 @@
+"""
+Benchmark tests
+Times the prediction hot paths with pytest-benchmark to catch regressions
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+
+class TestBenchmarks:
+    """Timing benchmarks for model and API prediction paths"""
+    
+    def test_bench_predict_batch(self, benchmark, gb_model, model_input):
+        """Benchmark a batched model.predict call"""
+        predictions = benchmark(gb_model.predict, model_input)
+        assert predictions.shape == (len(model_input),)
+    
+    def test_bench_forecast_api(self, benchmark, test_client, cities):
+        """Benchmark the 24-hour forecast endpoint"""
+        if not cities:
+            pytest.skip("No cities available")
+        
+        url = f"/api/forecast/{cities[0].lower()}?hours=24"
+        response = benchmark(test_client.get, url)
+        assert response.status_code == 200
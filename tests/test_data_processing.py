@@ -5,26 +5,40 @@ Tests data transformations and feature creation
 import pytest
 import pandas as pd
 import numpy as np
-from pathlib import Path
+from numpy.lib.stride_tricks import sliding_window_view
+import src.utils.feature_engineering as feature_engineering
+from src.utils.feature_engineering import AirQualityFeatureEngineer
+from src.utils.data_validator import DataValidator
+
+
+def trailing_windows(values, window):
+    """Trailing windows as a strided (len(values), window) view, NaN-padded at the start (min_periods=1)"""
+    padded = np.concatenate([np.full(window - 1, np.nan), np.asarray(values, dtype=np.float64)])
+    return sliding_window_view(padded, window)
+
+
+def shifted(values, periods):
+    """Values moved down by periods rows with NaN filling the head, like Series.shift"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.concatenate([np.full(periods, np.nan), values[:-periods]])
 
 
 class TestDataProcessing:
     """Test suite for data processing and feature engineering"""
     
-    def test_feature_engineering_rolling_mean(self):
+    def test_feature_engineering_rolling_mean(self, hourly_timestamps, synthetic_readings):
         """Test rolling mean feature creation"""
         df = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=100, freq='H'),
-            'aqi': np.random.uniform(20, 150, 100)
+            'timestamp': hourly_timestamps[:100],
+            'aqi': synthetic_readings['aqi']
         })
         
         # Create 3-hour rolling mean
-        df['aqi_rolling_3h_mean'] = df['aqi'].rolling(window=3, min_periods=1).mean()
+        df['aqi_rolling_3h_mean'] = np.nanmean(trailing_windows(df['aqi'].to_numpy(), 3), axis=1)
         
         assert 'aqi_rolling_3h_mean' in df.columns
         assert not df['aqi_rolling_3h_mean'].isna().all()
         assert len(df['aqi_rolling_3h_mean']) == len(df['aqi'])
-        print("✓ Rolling mean feature created successfully")
     
     def test_feature_engineering_rolling_max(self):
         """Test rolling max feature creation"""
@@ -32,11 +46,10 @@ class TestDataProcessing:
             'pm25': [30, 40, 50, 35, 45]
         })
         
-        df['pm25_rolling_3h_max'] = df['pm25'].rolling(window=3, min_periods=1).max()
+        df['pm25_rolling_3h_max'] = np.nanmax(trailing_windows(df['pm25'].to_numpy(), 3), axis=1)
         
         assert df['pm25_rolling_3h_max'].iloc[2] == 50  # Max of [30, 40, 50]
         assert df['pm25_rolling_3h_max'].iloc[4] == 50  # Max of [50, 35, 45]
-        print("✓ Rolling max feature created successfully")
     
     def test_feature_engineering_rolling_min(self):
         """Test rolling min feature creation"""
@@ -44,38 +57,31 @@ class TestDataProcessing:
             'pm25': [30, 40, 50, 35, 45]
         })
         
-        df['pm25_rolling_3h_min'] = df['pm25'].rolling(window=3, min_periods=1).min()
+        df['pm25_rolling_3h_min'] = np.nanmin(trailing_windows(df['pm25'].to_numpy(), 3), axis=1)
         
         assert df['pm25_rolling_3h_min'].iloc[2] == 30  # Min of [30, 40, 50]
         assert df['pm25_rolling_3h_min'].iloc[4] == 35  # Min of [50, 35, 45]
-        print("✓ Rolling min feature created successfully")
     
     def test_lag_features_1h(self):
         """Test 1-hour lag feature creation"""
-        df = pd.DataFrame({
-            'aqi': [50, 60, 70, 80, 90]
-        })
+        aqi = np.array([50, 60, 70, 80, 90])
         
-        df['aqi_lag_1h'] = df['aqi'].shift(1)
+        aqi_lag_1h = shifted(aqi, 1)
         
-        assert pd.isna(df['aqi_lag_1h'].iloc[0])  # First value should be NaN
-        assert df['aqi_lag_1h'].iloc[1] == 50
-        assert df['aqi_lag_1h'].iloc[2] == 60
-        assert df['aqi_lag_1h'].iloc[4] == 80
-        print("✓ Lag features created successfully")
+        assert np.isnan(aqi_lag_1h[0])  # First value should be NaN
+        assert aqi_lag_1h[1] == 50
+        assert aqi_lag_1h[2] == 60
+        assert aqi_lag_1h[4] == 80
     
     def test_lag_features_multiple_hours(self):
         """Test multiple hour lag features"""
-        df = pd.DataFrame({
-            'pm25': [30, 35, 40, 45, 50, 55]
-        })
+        pm25 = np.array([30, 35, 40, 45, 50, 55])
         
-        df['pm25_lag_1h'] = df['pm25'].shift(1)
-        df['pm25_lag_3h'] = df['pm25'].shift(3)
+        pm25_lag_1h = shifted(pm25, 1)
+        pm25_lag_3h = shifted(pm25, 3)
         
-        assert df['pm25_lag_1h'].iloc[2] == 35
-        assert df['pm25_lag_3h'].iloc[4] == 35
-        print("✓ Multiple lag features created successfully")
+        assert pm25_lag_1h[2] == 35
+        assert pm25_lag_3h[4] == 35
     
     def test_missing_value_handling_median(self):
         """Test missing value handling with median imputation"""
@@ -84,12 +90,12 @@ class TestDataProcessing:
             'aqi': [75, 80, np.nan, 85, 90, 88]
         })
         
-        # Fill with median
-        df_filled = df.fillna(df.median())
+        # Fill with median (computed once and reused by the assertion)
+        medians = df.median(numeric_only=True)
+        df_filled = df.fillna(medians)
         
         assert not df_filled.isna().any().any()
-        assert df_filled['pm25'].iloc[1] == df['pm25'].median()
-        print("✓ Missing values filled with median")
+        assert df_filled['pm25'].iloc[1] == medians['pm25']
     
     def test_missing_value_handling_forward_fill(self):
         """Test missing value handling with forward fill"""
@@ -97,17 +103,16 @@ class TestDataProcessing:
             'aqi': [50, 60, np.nan, np.nan, 70]
         })
         
-        df_filled = df.fillna(method='ffill')
+        df_filled = df.ffill()
         
         assert not df_filled.isna().any().any()
         assert df_filled['aqi'].iloc[2] == 60
         assert df_filled['aqi'].iloc[3] == 60
-        print("✓ Missing values forward filled")
     
-    def test_datetime_feature_extraction(self):
+    def test_datetime_feature_extraction(self, hourly_timestamps):
         """Test datetime feature extraction (hour, day, month)"""
         df = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=24, freq='H')
+            'timestamp': hourly_timestamps[:24]
         })
         
         df['hour'] = df['timestamp'].dt.hour
@@ -119,104 +124,344 @@ class TestDataProcessing:
         assert df['hour'].max() == 23
         assert df['day'].iloc[0] == 1
         assert df['month'].iloc[0] == 1
-        print("✓ Datetime features extracted successfully")
     
     def test_data_normalization(self):
         """Test data normalization"""
-        df = pd.DataFrame({
-            'pm25': [10, 20, 30, 40, 50]
-        })
+        pm25 = np.array([10, 20, 30, 40, 50])
         
         # Min-max normalization
-        df['pm25_normalized'] = (df['pm25'] - df['pm25'].min()) / (df['pm25'].max() - df['pm25'].min())
+        pm25_normalized = (pm25 - pm25.min()) / (pm25.max() - pm25.min())
         
-        assert df['pm25_normalized'].min() == 0
-        assert df['pm25_normalized'].max() == 1
-        print("✓ Data normalized successfully")
+        assert pm25_normalized.min() == 0
+        assert pm25_normalized.max() == 1
     
     def test_outlier_detection(self):
         """Test outlier detection using IQR method"""
-        df = pd.DataFrame({
-            'aqi': [50, 55, 60, 58, 62, 500, 54, 56]  # 500 is outlier
-        })
+        aqi = np.array([50, 55, 60, 58, 62, 500, 54, 56])  # 500 is outlier
         
-        Q1 = df['aqi'].quantile(0.25)
-        Q3 = df['aqi'].quantile(0.75)
+        Q1, Q3 = np.quantile(aqi, [0.25, 0.75])
         IQR = Q3 - Q1
         
-        outliers = df[(df['aqi'] < (Q1 - 1.5 * IQR)) | (df['aqi'] > (Q3 + 1.5 * IQR))]
+        outliers = aqi[(aqi < (Q1 - 1.5 * IQR)) | (aqi > (Q3 + 1.5 * IQR))]
         
         assert len(outliers) > 0
-        assert 500 in outliers['aqi'].values
-        print(f"✓ Outliers detected: {len(outliers)}")
+        assert 500 in outliers
     
-    def test_feature_correlation(self):
+    def test_feature_correlation(self, synthetic_readings):
         """Test feature correlation calculation"""
         df = pd.DataFrame({
-            'pm25': np.random.uniform(20, 100, 100),
-            'pm10': np.random.uniform(30, 150, 100),
-            'aqi': np.random.uniform(30, 120, 100)
+            'pm25': synthetic_readings['pm25'],
+            'pm10': synthetic_readings['pm10'],
+            'aqi': synthetic_readings['aqi']
         })
         
         correlation = df.corr()
         
         assert correlation.shape == (3, 3)
         assert correlation.loc['pm25', 'pm25'] == 1.0
-        print("✓ Feature correlation calculated")
     
-    def test_data_aggregation(self):
+    def test_data_aggregation(self, hourly_timestamps, synthetic_readings):
         """Test data aggregation by time periods"""
         df = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=72, freq='H'),
-            'aqi': np.random.uniform(30, 100, 72)
+            'timestamp': hourly_timestamps[:72],
+            'aqi': synthetic_readings['aqi'][:72]
         })
         
-        df['date'] = df['timestamp'].dt.date
-        daily_avg = df.groupby('date')['aqi'].mean()
+        # Day number as an int64 key: hashes in C, unlike datetime.date objects
+        df['date'] = df['timestamp'].to_numpy().astype('datetime64[D]').view(np.int64)
+        daily_avg = df.groupby('date', sort=False)['aqi'].mean()
         
         assert len(daily_avg) == 3  # 72 hours = 3 days
-        print(f"✓ Data aggregated to {len(daily_avg)} days")
     
-    def test_feature_set_loading(self):
+    def test_feature_set_loading(self, feature_sets):
         """Test loading feature sets from JSON"""
-        import json
-        feature_sets_path = Path("data/processed/feature_sets.json")
-        
-        if feature_sets_path.exists():
-            with open(feature_sets_path, 'r') as f:
-                feature_sets = json.load(f)
-            
-            assert 'comprehensive' in feature_sets
-            assert isinstance(feature_sets['comprehensive'], list)
-            assert len(feature_sets['comprehensive']) > 0
-            print(f"✓ Feature sets loaded ({len(feature_sets['comprehensive'])} features)")
-        else:
+        if feature_sets is None:
             pytest.skip("Feature sets file not found")
+        
+        assert 'comprehensive' in feature_sets
+        assert isinstance(feature_sets['comprehensive'], list)
+        assert len(feature_sets['comprehensive']) > 0
     
-    def test_data_type_validation(self):
+    def test_data_type_validation(self, hourly_timestamps):
         """Test data type validation"""
         df = pd.DataFrame({
             'pm25': [35.5, 42.1, 38.9],
             'city_name': ['Delhi', 'Mumbai', 'Kolkata'],
-            'timestamp': pd.date_range('2024-01-01', periods=3, freq='H')
+            'timestamp': hourly_timestamps[:3]
         })
         
         assert df['pm25'].dtype in [np.float64, np.float32]
         assert df['city_name'].dtype == object
         assert pd.api.types.is_datetime64_any_dtype(df['timestamp'])
-        print("✓ Data types validated")
     
     def test_duplicate_removal(self):
         """Test duplicate row removal"""
+        records = np.array(
+            [('2024-01-01 00:00', 50), ('2024-01-01 01:00', 60), ('2024-01-01 00:00', 50)],
+            dtype=[('timestamp', 'U16'), ('aqi', np.int64)]
+        )
+        
+        unique = np.unique(records)
+        
+        assert len(unique) == 2
+
+
+
+def rolling_edge_case_frame():
+    """
+    Interleaved city rows covering the rolling edge cases: leading and interior NaNs,
+    an all-NaN city, a city shorter than most windows and near-constant large values
+    """
+    rng = np.random.default_rng(3)
+    
+    leading_nan = rng.uniform(20, 150, 40)
+    leading_nan[:3] = np.nan
+    leading_nan[[10, 11, 25]] = np.nan
+    
+    near_constant = np.full(40, 1e4)
+    near_constant[5:] += rng.choice([-1.0, 0.0, 1.0], 35)
+    near_constant[20:30] = 1e4 + 1  # an exactly constant run
+    
+    cities = {
+        'lahore': leading_nan,
+        'karachi': np.full(12, np.nan),
+        'quetta': np.array([55.0, 61.5]),
+        'multan': near_constant
+    }
+    # Interleave the cities' rows at random, keeping each city's rows in time order
+    city_name = rng.permutation(np.repeat(list(cities), [len(v) for v in cities.values()]))
+    aqi = np.empty(len(city_name))
+    for city, values in cities.items():
+        aqi[city_name == city] = values
+    
+    return pd.DataFrame({'city_name': city_name, 'aqi': aqi})
+
+def dt_temporal_reference(df, timestamp_col='timestamp'):
+    """Temporal features the original way: .dt accessors, per-row isin and a season apply"""
+    df = df.copy()
+    df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+    timestamps = df[timestamp_col].dt
+    
+    df['hour'] = timestamps.hour
+    df['day_of_week'] = timestamps.dayofweek
+    df['month'] = timestamps.month
+    df['day_of_year'] = timestamps.dayofyear
+    df['week_of_year'] = timestamps.isocalendar().week
+    
+    df['hour_sin'] = np.sin(2 * np.pi * df['hour'] / 24)
+    df['hour_cos'] = np.cos(2 * np.pi * df['hour'] / 24)
+    df['dow_sin'] = np.sin(2 * np.pi * df['day_of_week'] / 7)
+    df['dow_cos'] = np.cos(2 * np.pi * df['day_of_week'] / 7)
+    df['month_sin'] = np.sin(2 * np.pi * (df['month'] - 1) / 12)
+    df['month_cos'] = np.cos(2 * np.pi * (df['month'] - 1) / 12)
+    df['day_of_year_sin'] = np.sin(2 * np.pi * (df['day_of_year'] - 1) / 365)
+    df['day_of_year_cos'] = np.cos(2 * np.pi * (df['day_of_year'] - 1) / 365)
+    
+    df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
+    df['is_rush_hour'] = df['hour'].isin([7, 8, 9, 17, 18, 19, 20]).astype(int)
+    df['is_night'] = df['hour'].isin(range(0, 6)).astype(int)
+    df['is_peak_pollution'] = df['hour'].isin([19, 20, 21]).astype(int)
+    df['season'] = df['month'].apply(
+        lambda x: 1 if x in [12, 1, 2] else 2 if x in [3, 4, 5] else 3 if x in [6, 7, 8] else 4
+    )
+    return df
+
+
+# Leap day, year boundary and a pre-1970 date
+TEMPORAL_EDGE_TIMESTAMPS = [
+    '2024-02-29 07:15', '2023-12-31 23:00', '2024-01-01 00:00', '1965-07-04 19:30', '2021-01-03 05:59'
+]
+
+
+class TestFeatureEngineer:
+    """Test suite for AirQualityFeatureEngineer against pandas/.dt references"""
+    
+    WINDOWS = [1, 3, 7, 50]
+    STATS = ['mean', 'std', 'min', 'max']
+    
+    def expected_rolling(self, df):
+        grouped = df.groupby('city_name', sort=False)['aqi']
+        return {
+            f'aqi_rolling_{window}h_{stat}': grouped.transform(
+                lambda s: getattr(s.rolling(window, min_periods=1), stat)()
+            ).to_numpy()
+            for window in self.WINDOWS for stat in self.STATS
+        }
+    
+    def assert_rolling_matches(self, df):
+        result = AirQualityFeatureEngineer()._rolling_columns(df, ['aqi'], self.WINDOWS, self.STATS)
+        expected = self.expected_rolling(df)
+        
+        assert list(result) == list(expected)
+        for name, values in expected.items():
+            np.testing.assert_allclose(result[name], values, rtol=1e-9, atol=1e-9, err_msg=name)
+    
+    def test_rolling_kernel_matches_pandas(self):
+        """Test the numba rolling kernel agrees with pandas groupby().rolling()"""
+        if feature_engineering._grouped_rolling_kernel is None:
+            pytest.skip("numba not installed")
+        self.assert_rolling_matches(rolling_edge_case_frame())
+    
+    def test_rolling_fallback_matches_pandas(self, monkeypatch):
+        """Test the pandas fallback (no numba) gives the same rolling statistics"""
+        monkeypatch.setattr(feature_engineering, '_grouped_rolling_kernel', None)
+        self.assert_rolling_matches(rolling_edge_case_frame())
+
+    
+    @pytest.mark.parametrize("timestamps", [
+        pd.Series(pd.to_datetime(TEMPORAL_EDGE_TIMESTAMPS)),
+        pd.Series(pd.to_datetime(TEMPORAL_EDGE_TIMESTAMPS + [None])),
+        pd.Series(pd.to_datetime(TEMPORAL_EDGE_TIMESTAMPS)).dt.tz_localize('Asia/Karachi'),
+        pd.Series(TEMPORAL_EDGE_TIMESTAMPS)
+    ], ids=['naive', 'naive_with_nat', 'tz_aware', 'strings'])
+    def test_temporal_features_match_dt_reference(self, timestamps):
+        """Test lookup-table temporal features match the .dt-based reference, values and dtypes"""
+        df = pd.DataFrame({'timestamp': timestamps, 'aqi': np.arange(len(timestamps), dtype=float)})
+        
+        result = AirQualityFeatureEngineer().create_temporal_features(df)
+        
+        pd.testing.assert_frame_equal(result, dt_temporal_reference(df))
+    
+    def test_engineer_all_features_column_order(self, hourly_timestamps, synthetic_readings):
+        """Test engineer_all_features lays out columns as the create_* methods applied in turn"""
+        n = 60
         df = pd.DataFrame({
-            'timestamp': ['2024-01-01 00:00', '2024-01-01 01:00', '2024-01-01 00:00'],
-            'aqi': [50, 60, 50]
+            'city_name': np.tile(['lahore', 'karachi', 'islamabad'], n // 3),
+            'timestamp': np.repeat(hourly_timestamps[:n // 3], 3),
+            'aqi': synthetic_readings['aqi'][:n],
+            'pm25': synthetic_readings['pm25'][:n],
+            'pm10': synthetic_readings['pm10'][:n],
+            'temperature': np.linspace(10, 30, n),
+            'humidity': np.linspace(30, 90, n),
+            'pressure': np.linspace(1005, 1020, n),
+            'wind_speed': np.linspace(0, 8, n)
+        }).sample(frac=1, random_state=0)
+        
+        engineer = AirQualityFeatureEngineer()
+        expected = df.sort_values(['city_name', 'timestamp']).reset_index(drop=True)
+        expected = engineer.create_temporal_features(expected)
+        expected = engineer.create_lag_features(expected, ['aqi', 'pm25', 'pm10', 'temperature', 'humidity'])
+        expected = engineer.create_rolling_features(expected, ['aqi', 'pm25', 'pm10'])
+        expected = engineer.create_change_features(expected, ['aqi', 'pm25', 'temperature', 'pressure'])
+        expected = engineer.create_weather_interactions(expected)
+        expected = engineer.create_pollutant_ratios(expected)
+        
+        result = engineer.engineer_all_features(df)
+        
+        assert list(result.columns) == list(expected.columns)
+        assert list(result['city_name']) == list(expected['city_name'])
+
+
+
+def per_column_range_issues(validator, df):
+    """Range warnings the original way: two comparisons per column"""
+    issues = []
+    for col, (min_val, max_val) in validator.valid_ranges.items():
+        if col in df.columns:
+            invalid_low = (df[col] < min_val).sum()
+            invalid_high = (df[col] > max_val).sum()
+            if invalid_low > 0:
+                issues.append(f"{col}: {invalid_low} values ({invalid_low / len(df) * 100:.2f}%) below valid range ({min_val})")
+            if invalid_high > 0:
+                issues.append(f"{col}: {invalid_high} values ({invalid_high / len(df) * 100:.2f}%) above valid range ({max_val})")
+    return issues
+
+
+def per_column_outliers(validator, df):
+    """IQR outlier stats the original way: quantiles and a boolean filter per column"""
+    outlier_stats = {}
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if col in validator.valid_ranges:
+            Q1 = df[col].quantile(0.25)
+            Q3 = df[col].quantile(0.75)
+            lower_bound = Q1 - 1.5 * (Q3 - Q1)
+            upper_bound = Q3 + 1.5 * (Q3 - Q1)
+            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
+            if len(outliers) > 0:
+                outlier_stats[col] = {
+                    'count': len(outliers),
+                    'percentage': round((len(outliers) / len(df)) * 100, 2),
+                    'lower_bound': round(lower_bound, 2),
+                    'upper_bound': round(upper_bound, 2)
+                }
+    return outlier_stats
+
+
+def series_temporal_issues(df):
+    """Temporal warnings the original way: Timestamp comparisons and a sorted Series diff"""
+    issues = []
+    future_dates = (df['timestamp'] > pd.Timestamp.now()).sum()
+    if future_dates > 0:
+        issues.append(f"Found {future_dates} records with future timestamps")
+    old_dates = (df['timestamp'] < pd.Timestamp.now() - pd.Timedelta(days=3650)).sum()
+    if old_dates > 0:
+        issues.append(f"Found {old_dates} records older than 10 years")
+    large_gaps = (df.sort_values('timestamp')['timestamp'].diff() > pd.Timedelta(days=7)).sum()
+    if large_gaps > 0:
+        issues.append(f"Found {large_gaps} time gaps larger than 7 days")
+    return issues
+
+
+class TestDataValidator:
+    """Test suite for DataValidator's shared-block checks against per-column references"""
+    
+    @pytest.mark.parametrize("timestamps", [
+        # Out of order, two NaTs, gaps of 9 and 30 days, one very old and one future date
+        ['2024-03-10', None, '2024-03-01', '2024-03-02', '2024-04-10', None, '2010-05-05', '2099-01-01'],
+        # Already sorted (no re-sort needed), one gap
+        ['2024-01-01', '2024-01-02', '2024-01-20', '2024-01-21'],
+        # Only NaT
+        [None, None]
+    ], ids=['unsorted_with_nat', 'sorted', 'all_nat'])
+    def test_temporal_consistency_matches_series_reference(self, timestamps):
+        """Test the int64-nanosecond temporal checks agree with the Series-based reference"""
+        df = pd.DataFrame({'timestamp': pd.to_datetime(timestamps)})
+        assert df['timestamp'].dtype == 'datetime64[ns]'
+        
+        issues = DataValidator().check_temporal_consistency(df)
+        
+        assert issues == series_temporal_issues(df)
+    
+    def test_temporal_consistency_counts(self):
+        """Test NaT is neither an old date nor a gap, and gaps are counted after sorting"""
+        df = pd.DataFrame({'timestamp': pd.to_datetime(
+            ['2024-03-10', None, '2024-03-01', '2024-03-02', '2024-04-10', None]
+        )})
+        
+        assert DataValidator().check_temporal_consistency(df) == ["Found 2 time gaps larger than 7 days"]
+    
+    def test_shared_block_matches_per_column_checks(self):
+        """Test range, missing and outlier results from the shared block with a nullable Int64 column"""
+        rng = np.random.default_rng(11)
+        n = 200
+        humidity = pd.array(rng.integers(20, 90, n), dtype='Int64')
+        humidity[[3, 50, 51]] = pd.NA
+        humidity[[7, 8]] = [150, 5]
+        pm25 = rng.normal(40, 8, n)
+        pm25[[10, 20]] = [np.nan, 700.0]
+        aqi = rng.integers(30, 160, n)
+        aqi[[0, 1, 2]] = [-5, 900, 480]
+        
+        # Column order differs from valid_ranges, so detect_outliers reorders the shared block
+        df = pd.DataFrame({
+            'station': ['A', 'B'] * (n // 2),
+            'humidity': humidity,
+            'pm25': pm25,
+            'aqi': aqi,
+            'pressure': rng.normal(1012, 4, n)
         })
         
-        df_unique = df.drop_duplicates()
+        validator = DataValidator()
+        column_stats = validator._column_stats(df)
+        assert column_stats['columns'] != [c for c in df.columns if c in validator.valid_ranges]
+        
+        assert validator.check_value_ranges(df, column_stats) == per_column_range_issues(validator, df)
+        assert validator.detect_outliers(df, column_stats) == per_column_outliers(validator, df)
+        assert validator.detect_outliers(df) == per_column_outliers(validator, df)
         
-        assert len(df_unique) == 2
-        print(f"✓ Duplicates removed ({len(df)} -> {len(df_unique)})")
+        missing = validator.check_missing_data(df, column_stats)
+        assert missing['by_column'] == df.isnull().sum()[lambda s: s > 0].to_dict()
+        assert missing['total_missing'] == df.isnull().sum().sum()
 
 
 if __name__ == "__main__":
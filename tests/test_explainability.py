@@ -0,0 +1,100 @@
+"""
+Explainability tests
+Tests SHAP explanations against small in-test tree models
+"""
+import pytest
+import numpy as np
+import pickle
+
+pytest.importorskip("shap")
+
+from src.explainability.shap_explainer import (
+    SHAPExplainer,
+    explain_aqi_category,
+    batch_explain_aqi_category
+)
+
+
+class TestSHAPExplainer:
+    """Test suite for SHAP explanations"""
+    
+    def test_batch_matches_single_row(self, shap_explainer, explainer_data):
+        """Test explain_predictions gives the same dict as explain_prediction for every row"""
+        X = explainer_data[0][:20]
+        batch = shap_explainer.explain_predictions(X)
+        
+        assert len(batch) == len(X)
+        for i, explanation in enumerate(batch):
+            assert explanation == shap_explainer.explain_prediction(X[i])
+    
+    def test_prediction_matches_model(self, shap_explainer, tree_model, explainer_data):
+        """Test reconstructed predictions match model.predict"""
+        X = explainer_data[0][:20]
+        predictions = [e['prediction'] for e in shap_explainer.explain_predictions(X)]
+        
+        np.testing.assert_allclose(predictions, tree_model.predict(X), rtol=1e-5, atol=1e-3)
+        assert shap_explainer.explain_prediction(X[0])['prediction'] == pytest.approx(
+            float(tree_model.predict(X[:1])[0]), rel=1e-5, abs=1e-3
+        )
+    
+    def test_base_value_plus_shap_is_prediction(self, shap_explainer, explainer_data):
+        """Test base_value + SHAP values adds up to the reported prediction"""
+        for explanation in shap_explainer.explain_predictions(explainer_data[0][:10]):
+            total = explanation['base_value'] + sum(explanation['shap_values'].values())
+            assert total == pytest.approx(explanation['prediction'], rel=1e-5, abs=1e-3)
+    
+    def test_max_contributions_truncation(self, shap_explainer, explainer_data):
+        """Test feature_contributions keeps only the largest |SHAP| features, in order"""
+        explanation = shap_explainer.explain_prediction(explainer_data[0][0], max_contributions=3)
+        
+        shap_values = explanation['shap_values']
+        expected = sorted(shap_values, key=lambda name: -abs(shap_values[name]))[:3]
+        
+        assert list(explanation['feature_contributions']) == expected
+        assert len(shap_values) == len(explainer_data[2])
+    
+    def test_save_load_round_trip(self, shap_explainer, tree_model, explainer_data, tmp_path):
+        """Test a saved explainer loads back and explains identically"""
+        path = tmp_path / "explainer.pkl"
+        shap_explainer.save(path)
+        
+        loaded = SHAPExplainer.load(path, tree_model)
+        x = explainer_data[0][0]
+        
+        assert loaded.feature_names == shap_explainer.feature_names
+        assert loaded.explain_prediction(x) == shap_explainer.explain_prediction(x)
+    
+    def test_load_reuses_cached_explainer(self, shap_explainer, tree_model, tmp_path):
+        """Test loading for the same XGBoost model reuses the built explainer (fingerprint cache)"""
+        if type(tree_model).__module__.split('.')[0] != 'xgboost':
+            pytest.skip("Fingerprint cache only applies to XGBoost models")
+        
+        path = tmp_path / "explainer.pkl"
+        shap_explainer.save(path)
+        
+        assert SHAPExplainer.load(path, tree_model).explainer is shap_explainer.explainer
+    
+    def test_load_plain_pickle(self, shap_explainer, tree_model, explainer_data, tmp_path):
+        """Test explainers saved as plain pickles (before joblib) still load"""
+        path = tmp_path / "explainer.pkl"
+        with open(path, 'wb') as f:
+            pickle.dump({'feature_names': explainer_data[2], 'base_value': 0.0}, f)
+        
+        loaded = SHAPExplainer.load(path, tree_model)
+        x = explainer_data[0][0]
+        
+        assert loaded.feature_names == explainer_data[2]
+        assert loaded.explain_prediction(x) == shap_explainer.explain_prediction(x)
+    
+    def test_batch_explain_aqi_category(self, shap_explainer, explainer_data):
+        """Test batch AQI explanations match the per-value ones"""
+        explanations = shap_explainer.explain_predictions(explainer_data[0][:5])
+        aqi_values = np.array([25.0, 75.0, 125.0, 250.0, 400.0])
+        
+        assert batch_explain_aqi_category(aqi_values, explanations) == [
+            explain_aqi_category(aqi, explanation) for aqi, explanation in zip(aqi_values, explanations)
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])